@@ -46,6 +46,53 @@ public class PrerequisiteCheckerTests
         missing.Should().ContainSingle().Which.Should().Be(expectedMissing);
     }
 
+    [Fact]
+    public void GetMissingTools_WithResolver_LaterLaunchesReuseStartupLookups()
+    {
+        var pathValue = BuildPath("/usr/local/bin", "/usr/bin");
+        var existing = CreateSet(new[] { Path.Combine("/usr/bin", "makemkvcon"), Path.Combine("/usr/bin", "ffmpeg") });
+        var probes = new List<string>();
+        var resolver = new ToolPathResolver(pathValue, isWindows: false, path => { probes.Add(path); return existing.Contains(path); });
+
+        PrerequisiteChecker.GetMissingTools(resolver).Should().BeEmpty();
+        var probesAtStartup = probes.Count;
+
+        resolver.Resolve("ffmpeg").Should().Be(Path.Combine("/usr/bin", "ffmpeg"));
+        resolver.Resolve("makemkvcon").Should().Be(Path.Combine("/usr/bin", "makemkvcon"));
+        probes.Should().HaveCount(probesAtStartup);
+    }
+
+    [Fact]
+    public void GetMissingTools_WithResolver_MissingToolIsSearchedAgain()
+    {
+        var probes = 0;
+        var resolver = new ToolPathResolver(BuildPath("/usr/bin"), isWindows: false, _ => { probes++; return false; });
+
+        PrerequisiteChecker.GetMissingTools(resolver).Should().Equal(PrerequisiteChecker.RequiredTools);
+        resolver.Resolve("ffmpeg").Should().BeNull();
+
+        probes.Should().Be(PrerequisiteChecker.RequiredTools.Length + 1);
+    }
+
+    [Fact]
+    public void ResolveToolPath_ReturnsFirstMatchingDirectory()
+    {
+        var pathValue = BuildPath("/usr/local/bin", "/usr/bin");
+        var existing = CreateSet(new[] { Path.Combine("/usr/local/bin", "ffmpeg"), Path.Combine("/usr/bin", "ffmpeg") });
+
+        var resolved = PrerequisiteChecker.ResolveToolPath("ffmpeg", pathValue, isWindows: false, existing.Contains);
+
+        resolved.Should().Be(Path.Combine("/usr/local/bin", "ffmpeg"));
+    }
+
+    [Fact]
+    public void ResolveToolPath_WhenToolMissing_ReturnsNull()
+    {
+        var resolved = PrerequisiteChecker.ResolveToolPath("ffmpeg", BuildPath("/usr/bin"), isWindows: false, _ => false);
+
+        resolved.Should().BeNull();
+    }
+
     public static IEnumerable<object[]> NonWindowsAllPresentCases()
     {
         yield return new object[]
@@ -654,4 +654,37 @@ public class RipOptionsTests
 
         result.EnableParallelProcessing.Should().BeFalse();
     }
+
+    [Fact]
+    public void ParseArgs_WithoutEncodeJobs_DefaultsTo1()
+    {
+        var args = new[] { "--output", "/tmp/movies" };
+
+        var result = RipOptions.ParseArgs(args);
+
+        result.EncodeJobs.Should().Be(1);
+    }
+
+    [Fact]
+    public void ParseArgs_WithEncodeJobs_ParsesCorrectly()
+    {
+        var args = new[] { "--output", "/tmp/movies", "--encode-jobs", "3" };
+
+        var result = RipOptions.ParseArgs(args);
+
+        result.EncodeJobs.Should().Be(3);
+    }
+
+    [Theory]
+    [InlineData("0")]
+    [InlineData("-2")]
+    [InlineData("many")]
+    public void ParseArgs_WithInvalidEncodeJobs_KeepsDefault(string value)
+    {
+        var args = new[] { "--output", "/tmp/movies", "--encode-jobs", value };
+
+        var result = RipOptions.ParseArgs(args);
+
+        result.EncodeJobs.Should().Be(1);
+    }
 }
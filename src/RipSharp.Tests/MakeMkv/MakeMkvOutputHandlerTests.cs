@@ -0,0 +1,57 @@
+namespace RipSharp.Tests.MakeMkv;
+
+public class MakeMkvOutputHandlerTests
+{
+    [Fact]
+    public void HandleLine_WithoutLogPaths_TracksProgressAndWritesNothing()
+    {
+        var writer = Substitute.For<IConsoleWriter>();
+        var handler = new MakeMkvOutputHandler(1000, 0, 1, null, null, null, writer, ThemeProvider.CreateDefault());
+
+        handler.HandleLine("PRGV:0.5");
+        handler.HandleLine("PRGC:5018,0,\"Saving to MKV file\"");
+
+        handler.LastProgressFraction.Should().Be(0.5);
+        handler.LastBytesProcessed.Should().Be(500);
+        writer.DidNotReceiveWithAnyArgs().Error(default!);
+    }
+
+    [Fact]
+    public void HandleLine_RepeatedCaption_UpdatesTaskDescriptionOnlyOnChange()
+    {
+        var task = Substitute.For<IProgressTask>();
+        var handler = new MakeMkvOutputHandler(1000, 1, 3, task, null, null, Substitute.For<IConsoleWriter>(), ThemeProvider.CreateDefault());
+
+        handler.HandleLine("PRGV:0.5");
+        handler.HandleLine("PRGC:5018,0,\"Saving to MKV file\"");
+        handler.HandleLine("PRGC:5018,0,\"Saving to MKV file\"");
+
+        task.ReceivedWithAnyArgs(1).Description = default!;
+        task.Received(1).Description = Arg.Is<string>(d => d.Contains("Saving to MKV file (2/3)"));
+        task.DidNotReceiveWithAnyArgs().Value = default;
+    }
+
+    [Fact]
+    public void HandleLine_WithLogPaths_AppendsRawAndProgressLogs()
+    {
+        var tempDir = Path.Combine(Path.GetTempPath(), $"ripsharp-tests-{Path.GetRandomFileName()}");
+        Directory.CreateDirectory(tempDir);
+
+        try
+        {
+            var progressLog = Path.Combine(tempDir, "progress.log");
+            var rawLog = Path.Combine(tempDir, "raw.log");
+            using (var handler = new MakeMkvOutputHandler(1000, 0, 1, null, progressLog, rawLog, Substitute.For<IConsoleWriter>(), ThemeProvider.CreateDefault()))
+            {
+                handler.HandleLine("PRGV:0.5");
+            }
+
+            File.ReadAllText(rawLog).Should().Be("PRGV:0.5\n");
+            File.ReadAllText(progressLog).Should().Be("PRGV 500\n");
+        }
+        finally
+        {
+            Directory.Delete(tempDir, recursive: true);
+        }
+    }
+}
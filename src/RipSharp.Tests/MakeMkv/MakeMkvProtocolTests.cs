@@ -21,4 +21,25 @@ public class MakeMkvProtocolTests
 
         result.Should().BeNull();
     }
+
+    [Theory]
+    [InlineData("CINFO:2,0,\"Heat\"", "Heat")]
+    [InlineData("MSG:3025,0,1,\"Title #1 is short\",\"Title #%1 is short\",\"1\"", "Title #1 is short")]
+    [InlineData("MSG:1005,0,0,\"unterminated", null)]
+    [InlineData("CINFO:2,0,\"\"", null)]
+    public void ExtractQuoted_MatchesFirstNonEmptyQuotedSpan(string line, string? expected)
+    {
+        MakeMkvProtocol.ExtractQuoted(line).Should().Be(expected);
+    }
+
+    [Theory]
+    [InlineData("PRGV:10,20,65536", true)]
+    [InlineData("PRGC:5018,0,\"Saving to MKV file\"", true)]
+    [InlineData("PRGT:5018,0,\"Saving to MKV file\"", false)]
+    [InlineData("MSG:5010,0,0,\"Failed to open disc\"", false)]
+    [InlineData("Error: PRGV", false)]
+    public void IsProgressLine_MatchesOnlyProgressPrefixes(string line, bool expected)
+    {
+        MakeMkvProtocol.IsProgressLine(line).Should().Be(expected);
+    }
 }
@@ -0,0 +1,110 @@
+namespace RipSharp.Tests.MakeMkv;
+
+public class ScanOutputHandlerTests
+{
+    [Fact]
+    public void HandleLine_TitleInfo_PopulatesNameDurationAndSize()
+    {
+        var titles = new List<TitleInfo>();
+        var handler = CreateHandler(titles);
+
+        handler.HandleLine("TINFO:0,2,0,\"Main Feature\"");
+        handler.HandleLine("TINFO:0,9,0,\"1:30:05\"");
+        handler.HandleLine("TINFO:0,11,0,\"1234567\"");
+
+        var title = titles.Should().ContainSingle().Subject;
+        title.Id.Should().Be(0);
+        title.Name.Should().Be("Main Feature");
+        title.DurationSeconds.Should().Be(5405);
+        title.ReportedSizeBytes.Should().Be(1234567);
+    }
+
+    [Theory]
+    [InlineData("0:45:30", 2730)]
+    [InlineData("1:30", 0)]
+    [InlineData("1:30:05:00", 0)]
+    [InlineData("x:30:05", 0)]
+    public void HandleLine_TitleDuration_ParsesOnlyHoursMinutesSeconds(string duration, int expectedSeconds)
+    {
+        var titles = new List<TitleInfo>();
+        var handler = CreateHandler(titles);
+
+        handler.HandleLine($"TINFO:0,9,0,\"{duration}\"");
+
+        titles.Should().ContainSingle().Which.DurationSeconds.Should().Be(expectedSeconds);
+    }
+
+    [Fact]
+    public void HandleLine_InterleavedTitles_CreatesOneEntryPerTitleInFirstSeenOrder()
+    {
+        var titles = new List<TitleInfo>();
+        var handler = CreateHandler(titles);
+
+        handler.HandleLine("TINFO:3,9,0,\"0:22:00\"");
+        handler.HandleLine("TINFO:1,9,0,\"0:23:00\"");
+        handler.HandleLine("TINFO:3,11,0,\"100\"");
+        handler.HandleLine("TINFO:1,11,0,\"200\"");
+
+        titles.Select(t => t.Id).Should().Equal(3, 1);
+        titles[0].DurationSeconds.Should().Be(1320);
+        titles[0].ReportedSizeBytes.Should().Be(100);
+        titles[1].DurationSeconds.Should().Be(1380);
+        titles[1].ReportedSizeBytes.Should().Be(200);
+    }
+
+    [Fact]
+    public void HandleLine_DispatchesDiscInfoByPrefix()
+    {
+        var titles = new List<TitleInfo>();
+        var handler = CreateHandler(titles);
+
+        handler.HandleLine("DRV:0,2,999,1,\"BD-RE\",\"MOVIE_DISC\",\"/dev/sr0\"");
+        handler.HandleLine("CINFO:1,6209,\"Blu-ray disc\"");
+        handler.HandleLine("CINFO:2,0,\"MOVIE_DISC\"");
+        handler.HandleLine("not a protocol line");
+
+        handler.DiscType.Should().Be("Blu-ray disc");
+        handler.DiscName.Should().Be("MOVIE_DISC");
+        titles.Should().BeEmpty();
+    }
+
+    [Fact]
+    public void HandleLine_TitleNameAttribute_AnnouncesEachNameOnce()
+    {
+        var notifier = Substitute.For<IConsoleWriter>();
+        var handler = new ScanOutputHandler(notifier, ThemeProvider.CreateDefault(), new List<TitleInfo>());
+
+        handler.HandleLine("TINFO:0,2,0,\"Main Feature\"");
+        handler.HandleLine("TINFO:1,2,0,\"Main Feature\"");
+        handler.HandleLine("TINFO:0,9,0,\"1:30:05\"");
+        handler.HandleLine("TINFO:0,2");
+
+        notifier.Received(1).Highlight(Arg.Is<string>(m => m.Contains("Title found: Main Feature")));
+        notifier.Received(1).Highlight(Arg.Any<string>());
+    }
+
+    [Fact]
+    public void HandleLine_Messages_DispatchByCode()
+    {
+        var notifier = Substitute.For<IConsoleWriter>();
+        var handler = new ScanOutputHandler(notifier, ThemeProvider.CreateDefault(), new List<TitleInfo>());
+
+        handler.HandleLine("MSG:1005,0,1,\"MakeMKV v1.18.2 linux(x64-release) started\",\"%1 started\",\"MakeMKV v1.18.2 linux(x64-release)\"");
+        handler.HandleLine("MSG:3307,0,2,\"File 00800.mpls was added as title #0\",\"File %1 was added as title #%2\",\"00800.mpls\",\"0\"");
+        handler.HandleLine("MSG:3307,0,2,\"File 00801.mpls was added as title #1\",\"File %1 was added as title #%2\",\"00801.mpls\",\"1\"");
+        handler.HandleLine("MSG:3309,0,2,\"Title 00802.mpls is equal to title 00800.mpls and was skipped\",\"\",\"\",\"\"");
+        handler.HandleLine("MSG:2003,0,3,\"Error 'Scsi error - MEDIUM ERROR' occurred while reading '/BDMV/STREAM/00800.m2ts' at offset '0'\",\"Error '%1' occurred while reading '%2' at offset '%3'\",\"Scsi error - MEDIUM ERROR\",\"/BDMV/STREAM/00800.m2ts\",\"0\"");
+
+        handler.TitleAddedCount.Should().Be(2);
+        notifier.Received(1).Muted("▸ MakeMKV v1.18.2 linux(x64-release) started");
+        notifier.Received(1).Success(Arg.Is<string>(m => m.Contains("Added title #1: 00801.mpls")));
+        notifier.Received(1).Muted("  ~ Skipped duplicate: 00802.mpls");
+        notifier.Received(1).Error(Arg.Is<string>(m => m.EndsWith("Error 'Scsi error - MEDIUM ERROR' occurred while reading '/BDMV/STREAM/00800.m2ts' at offset '0'")));
+    }
+
+    private static ScanOutputHandler CreateHandler(List<TitleInfo> titles)
+    {
+        var notifier = Substitute.For<IConsoleWriter>();
+        return new ScanOutputHandler(notifier, ThemeProvider.CreateDefault(), titles);
+    }
+}
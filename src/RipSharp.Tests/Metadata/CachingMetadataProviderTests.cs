@@ -0,0 +1,103 @@
+namespace RipSharp.Tests.Metadata;
+
+public class CachingMetadataProviderTests : IDisposable
+{
+    private readonly string _tempDir = Path.Combine(Path.GetTempPath(), $"ripsharp-tests-{Path.GetRandomFileName()}");
+
+    public void Dispose()
+    {
+        if (Directory.Exists(_tempDir))
+            Directory.Delete(_tempDir, recursive: true);
+    }
+
+    [Fact]
+    public async Task LookupAsync_ReusesCachedHitAcrossInstances()
+    {
+        var cachePath = Path.Combine(_tempDir, "cache", "metadata-cache.json");
+        var inner = Substitute.For<IMetadataProvider>();
+        inner.Name.Returns("TMDB");
+        inner.LookupAsync("Heat", false, 1995).Returns(new ContentMetadata { Title = "Heat", Year = 1995, Type = "movie" });
+
+        var first = await new CachingMetadataProvider(inner, new MetadataCache(cachePath)).LookupAsync("Heat", false, 1995);
+        var second = await new CachingMetadataProvider(inner, new MetadataCache(cachePath)).LookupAsync("HEAT ", false, 1995);
+
+        first!.Title.Should().Be("Heat");
+        second.Should().NotBeNull();
+        second!.Year.Should().Be(1995);
+        await inner.Received(1).LookupAsync(Arg.Any<string>(), Arg.Any<bool>(), Arg.Any<int?>());
+    }
+
+    [Fact]
+    public async Task LookupAsync_DoesNotCacheMisses()
+    {
+        var cache = new MetadataCache(Path.Combine(_tempDir, "metadata-cache.json"));
+        var inner = Substitute.For<IMetadataProvider>();
+        inner.Name.Returns("OMDB");
+        inner.LookupAsync(Arg.Any<string>(), Arg.Any<bool>(), Arg.Any<int?>()).Returns((ContentMetadata?)null);
+        var provider = new CachingMetadataProvider(inner, cache);
+
+        await provider.LookupAsync("Unknown", true, null);
+        await provider.LookupAsync("Unknown", true, null);
+
+        await inner.Received(2).LookupAsync("Unknown", true, null);
+    }
+
+    [Fact]
+    public void MetadataCache_IgnoresCorruptFile()
+    {
+        Directory.CreateDirectory(_tempDir);
+        var cachePath = Path.Combine(_tempDir, "metadata-cache.json");
+        File.WriteAllText(cachePath, "{not json");
+        var cache = new MetadataCache(cachePath);
+
+        cache.TryGet("anything", out _, out _).Should().BeFalse();
+
+        cache.Set("key", new ContentMetadata { Title = "Saved" });
+        new MetadataCache(cachePath).TryGet("key", out var saved, out _).Should().BeTrue();
+        saved!.Title.Should().Be("Saved");
+    }
+
+    [Fact]
+    public async Task LookupAsync_RefreshesEntriesOlderThanTheirMaxAge()
+    {
+        Directory.CreateDirectory(_tempDir);
+        var cachePath = Path.Combine(_tempDir, "metadata-cache.json");
+        var fetched = DateTime.UtcNow.AddDays(-2).ToString("O");
+        File.WriteAllText(cachePath, $$"""
+            {
+              "TMDB|movie||heat": { "Metadata": { "Title": "Heat", "Year": 1995, "Type": "movie" }, "FetchedUtc": "{{fetched}}" },
+              "TMDB|tv||lost": { "Metadata": { "Title": "Lost", "Type": "tv" }, "FetchedUtc": "{{fetched}}" }
+            }
+            """);
+        var inner = Substitute.For<IMetadataProvider>();
+        inner.Name.Returns("TMDB");
+        inner.LookupAsync("Lost", true, null).Returns(new ContentMetadata { Title = "Lost", Type = "tv" });
+        var provider = new CachingMetadataProvider(inner, new MetadataCache(cachePath));
+
+        var movie = await provider.LookupAsync("Heat", false, null);
+        var show = await provider.LookupAsync("Lost", true, null);
+
+        movie!.Year.Should().Be(1995);
+        show!.Title.Should().Be("Lost");
+        await inner.DidNotReceive().LookupAsync("Heat", Arg.Any<bool>(), Arg.Any<int?>());
+        await inner.Received(1).LookupAsync("Lost", true, null);
+    }
+
+    [Fact]
+    public async Task LookupAsync_FallsBackToExpiredEntry_WhenRefreshFindsNothing()
+    {
+        Directory.CreateDirectory(_tempDir);
+        var cachePath = Path.Combine(_tempDir, "metadata-cache.json");
+        File.WriteAllText(cachePath, $$"""
+            { "OMDB|tv||lost": { "Metadata": { "Title": "Lost", "Type": "tv" }, "FetchedUtc": "{{DateTime.UtcNow.AddDays(-3):O}}" } }
+            """);
+        var inner = Substitute.For<IMetadataProvider>();
+        inner.Name.Returns("OMDB");
+        inner.LookupAsync(Arg.Any<string>(), Arg.Any<bool>(), Arg.Any<int?>()).Returns((ContentMetadata?)null);
+
+        var result = await new CachingMetadataProvider(inner, new MetadataCache(cachePath)).LookupAsync("Lost", true, null);
+
+        result!.Title.Should().Be("Lost");
+        await inner.Received(1).LookupAsync("Lost", true, null);
+    }
+}
@@ -75,6 +75,19 @@ public class OmdbMetadataProviderTests
         result.Should().BeNull();
     }
 
+    [Fact]
+    public async Task LookupAsync_ReturnsNull_WhenResponseBodyIsCutOff()
+    {
+        var handler = new TruncatedResponseHandler(@"{""Response"":""True"",""Title"":""Incep");
+        var httpClient = new HttpClient(handler);
+        var notifier = Substitute.For<IConsoleWriter>();
+        var provider = new OmdbMetadataProvider(httpClient, "test-key", notifier);
+
+        var result = await provider.LookupAsync("test", isTv: false, year: null);
+
+        result.Should().BeNull();
+    }
+
     [Fact]
     public void Name_ReturnsOMDB()
     {
@@ -75,6 +75,19 @@ public class TmdbMetadataProviderTests
         result.Should().BeNull();
     }
 
+    [Fact]
+    public async Task LookupAsync_ReturnsNull_WhenResponseBodyIsCutOff()
+    {
+        var handler = new TruncatedResponseHandler(@"{""results"":[{""title"":""The Matrix""");
+        var httpClient = new HttpClient(handler);
+        var notifier = Substitute.For<IConsoleWriter>();
+        var provider = new TmdbMetadataProvider(httpClient, "test-key", notifier);
+
+        var result = await provider.LookupAsync("test", isTv: false, year: null);
+
+        result.Should().BeNull();
+    }
+
     [Fact]
     public void Name_ReturnsTMDB()
     {
@@ -0,0 +1,47 @@
+using System.Net;
+
+namespace RipSharp.Tests.Metadata;
+
+/// <summary>
+/// Answers every request with 200 OK and a body that fails part way through, the way a reset connection does.
+/// </summary>
+internal class TruncatedResponseHandler : HttpMessageHandler
+{
+    private readonly byte[] _partialBody;
+
+    public TruncatedResponseHandler(string partialBody)
+    {
+        _partialBody = System.Text.Encoding.UTF8.GetBytes(partialBody);
+    }
+
+    protected override Task<HttpResponseMessage> SendAsync(HttpRequestMessage request, CancellationToken cancellationToken)
+    {
+        return Task.FromResult(new HttpResponseMessage(HttpStatusCode.OK)
+        {
+            Content = new StreamContent(new TruncatedStream(_partialBody))
+        });
+    }
+
+    private class TruncatedStream : MemoryStream
+    {
+        private bool _served;
+
+        public TruncatedStream(byte[] partialBody) : base(partialBody) { }
+
+        public override int Read(byte[] buffer, int offset, int count) => Read(buffer.AsSpan(offset, count));
+
+        public override int Read(Span<byte> buffer)
+        {
+            if (_served)
+                throw new IOException("The response ended prematurely.");
+            _served = true;
+            return base.Read(buffer);
+        }
+
+        public override Task<int> ReadAsync(byte[] buffer, int offset, int count, CancellationToken cancellationToken) =>
+            Task.FromResult(Read(buffer, offset, count));
+
+        public override ValueTask<int> ReadAsync(Memory<byte> buffer, CancellationToken cancellationToken = default) =>
+            ValueTask.FromResult(Read(buffer.Span));
+    }
+}
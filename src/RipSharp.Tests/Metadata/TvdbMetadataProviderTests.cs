@@ -0,0 +1,73 @@
+using System.Net;
+
+namespace RipSharp.Tests.Metadata;
+
+public class TvdbMetadataProviderTests
+{
+    [Fact]
+    public async Task GetEpisodeTitleAsync_SeriesNotFound_ConcurrentCallsShareOneLoginAndSearch()
+    {
+        var handler = new FakeHttpMessageHandler(request => request.RequestUri!.AbsolutePath switch
+        {
+            "/v4/login" => @"{""data"":{""token"":""abc""}}",
+            "/v4/search" => @"{""data"":[]}",
+            _ => throw new InvalidOperationException($"Unexpected request {request.RequestUri}")
+        });
+        var provider = new TvdbMetadataProvider(new HttpClient(handler), "test-key", Substitute.For<IConsoleWriter>());
+
+        var titles = await Task.WhenAll(Enumerable.Range(1, 8)
+            .Select(episode => provider.GetEpisodeTitleAsync("Unknown Show", 1, episode, null)));
+
+        titles.Should().AllSatisfy(t => t.Should().BeNull());
+        handler.RequestCount("/v4/login").Should().Be(1);
+        handler.RequestCount("/v4/search").Should().Be(1);
+    }
+
+    [Fact]
+    public async Task GetEpisodeTitleAsync_SeriesFound_FetchesEachEpisodeAfterOneLoginAndSearch()
+    {
+        var handler = new FakeHttpMessageHandler(request => request.RequestUri!.AbsolutePath switch
+        {
+            "/v4/login" => @"{""data"":{""token"":""abc""}}",
+            "/v4/search" => @"{""data"":[{""tvdb_id"":""42"",""name"":""Show""}]}",
+            "/v4/series/42/episodes/default" => @"{""data"":{""episodes"":[{""name"":""Pilot""}]}}",
+            _ => throw new InvalidOperationException($"Unexpected request {request.RequestUri}")
+        });
+        var provider = new TvdbMetadataProvider(new HttpClient(handler), "test-key", Substitute.For<IConsoleWriter>());
+
+        var titles = await Task.WhenAll(Enumerable.Range(1, 4)
+            .Select(episode => provider.GetEpisodeTitleAsync("Show", 1, episode, null)));
+
+        titles.Should().AllBe("Pilot");
+        handler.RequestCount("/v4/login").Should().Be(1);
+        handler.RequestCount("/v4/search").Should().Be(1);
+        handler.RequestCount("/v4/series/42/episodes/default").Should().Be(4);
+    }
+
+    private class FakeHttpMessageHandler : HttpMessageHandler
+    {
+        private readonly Func<HttpRequestMessage, string> _respond;
+        private readonly Dictionary<string, int> _requestCounts = new();
+
+        public FakeHttpMessageHandler(Func<HttpRequestMessage, string> respond)
+        {
+            _respond = respond;
+        }
+
+        public int RequestCount(string path)
+        {
+            lock (_requestCounts)
+                return _requestCounts.GetValueOrDefault(path);
+        }
+
+        protected override async Task<HttpResponseMessage> SendAsync(HttpRequestMessage request, CancellationToken cancellationToken)
+        {
+            lock (_requestCounts)
+                _requestCounts[request.RequestUri!.AbsolutePath] = _requestCounts.GetValueOrDefault(request.RequestUri.AbsolutePath) + 1;
+
+            // Let concurrent callers pile up while the request is in flight
+            await Task.Delay(20, cancellationToken);
+            return new HttpResponseMessage(HttpStatusCode.OK) { Content = new StringContent(_respond(request)) };
+        }
+    }
+}
@@ -0,0 +1,27 @@
+namespace RipSharp.Tests.Models;
+
+public class DiscInfoTests
+{
+    [Fact]
+    public void TitlesById_KeepsFirstTitleForDuplicateIds()
+    {
+        var first = new TitleInfo { Id = 1, Name = "first" };
+        var info = new DiscInfo { Titles = new List<TitleInfo> { first, new() { Id = 1, Name = "second" }, new() { Id = 2 } } };
+
+        info.TitlesById.Should().HaveCount(2);
+        info.TitlesById[1].Should().BeSameAs(first);
+    }
+
+    [Fact]
+    public void TitlesById_ReflectsAddedAndReplacedTitles()
+    {
+        var info = new DiscInfo();
+        info.TitlesById.Should().BeEmpty();
+
+        info.Titles.Add(new TitleInfo { Id = 3 });
+        info.TitlesById.Keys.Should().Equal(3);
+
+        info.Titles = new List<TitleInfo> { new() { Id = 7 } };
+        info.TitlesById.Keys.Should().Equal(7);
+    }
+}
@@ -0,0 +1,33 @@
+using System.Reflection;
+using System.Threading.Channels;
+
+namespace RipSharp.Tests.Services;
+
+public class DiscRipperResultOrderTests
+{
+    [Fact]
+    public async Task CollectResultsAsync_ReturnsFilesInTitleOrderWhenEncodesFinishOutOfOrder()
+    {
+        var ripper = new DiscRipper(
+            Substitute.For<IDiscScanner>(),
+            Substitute.For<IEncoderService>(),
+            Substitute.For<IMetadataService>(),
+            Substitute.For<IMakeMkvService>(),
+            Substitute.For<IConsoleWriter>(),
+            Substitute.For<IUserPrompt>(),
+            Substitute.For<ITvEpisodeTitleProvider>(),
+            Substitute.For<IProgressDisplay>(),
+            ThemeProvider.CreateDefault());
+        var resultChannel = Channel.CreateUnbounded<EncodeResult>();
+        resultChannel.Writer.TryWrite(new EncodeResult(7, true, "/out/episode3.mkv"));
+        resultChannel.Writer.TryWrite(new EncodeResult(2, false, ErrorMessage: "Failed to encode title 2"));
+        resultChannel.Writer.TryWrite(new EncodeResult(4, true, "/out/episode1.mkv"));
+        resultChannel.Writer.Complete();
+
+        var method = typeof(DiscRipper).GetMethod("CollectResultsAsync", BindingFlags.NonPublic | BindingFlags.Instance);
+        method.Should().NotBeNull();
+        var files = await (Task<List<string>>)method!.Invoke(ripper, new object[] { resultChannel, new List<int> { 4, 2, 7 }, CancellationToken.None })!;
+
+        files.Should().Equal("/out/episode1.mkv", "/out/episode3.mkv");
+    }
+}
@@ -0,0 +1,141 @@
+using System.Reflection;
+
+namespace RipSharp.Tests.Services;
+
+public class DiscRipperRippedFileLookupTests
+{
+    [Fact]
+    public void FindRippedMkv_IgnoresExcludedFilesAndPicksNewest()
+    {
+        var tempDir = Path.Combine(Path.GetTempPath(), $"ripsharp-tests-{Path.GetRandomFileName()}");
+        Directory.CreateDirectory(tempDir);
+
+        try
+        {
+            var existing = CreateFile(tempDir, "existing.mkv", DateTime.Now.AddMinutes(5));
+            CreateFile(tempDir, "older.mkv", DateTime.Now.AddMinutes(-5));
+            var newest = CreateFile(tempDir, "newest.mkv", DateTime.Now);
+            CreateFile(tempDir, "notes.txt", DateTime.Now.AddMinutes(10));
+
+            var result = InvokeFindRippedMkv(tempDir, 0, new HashSet<string> { existing });
+
+            result.Should().Be(newest);
+        }
+        finally
+        {
+            Directory.Delete(tempDir, recursive: true);
+        }
+    }
+
+    [Fact]
+    public void FindRippedMkv_ReturnsNull_WhenNoNewFiles()
+    {
+        var tempDir = Path.Combine(Path.GetTempPath(), $"ripsharp-tests-{Path.GetRandomFileName()}");
+        Directory.CreateDirectory(tempDir);
+
+        try
+        {
+            var existing = CreateFile(tempDir, "existing.mkv", DateTime.Now);
+
+            var result = InvokeFindRippedMkv(tempDir, 0, new HashSet<string> { existing });
+
+            result.Should().BeNull();
+        }
+        finally
+        {
+            Directory.Delete(tempDir, recursive: true);
+        }
+    }
+
+    [Fact]
+    public void FindRippedMkv_PrefersFileNamedForTitle()
+    {
+        var tempDir = Path.Combine(Path.GetTempPath(), $"ripsharp-tests-{Path.GetRandomFileName()}");
+        Directory.CreateDirectory(tempDir);
+
+        try
+        {
+            var titleFile = CreateFile(tempDir, "B1_t03.mkv", DateTime.Now.AddMinutes(-5));
+            CreateFile(tempDir, "B1_t04.mkv", DateTime.Now);
+
+            var result = InvokeFindRippedMkv(tempDir, 3, new HashSet<string>());
+
+            result.Should().Be(titleFile);
+        }
+        finally
+        {
+            Directory.Delete(tempDir, recursive: true);
+        }
+    }
+
+    [Fact]
+    public void RememberRipOutput_AddsRippedFile_WithoutPickingUpOthers()
+    {
+        var tempDir = Path.Combine(Path.GetTempPath(), $"ripsharp-tests-{Path.GetRandomFileName()}");
+        Directory.CreateDirectory(tempDir);
+
+        try
+        {
+            var ripped = CreateFile(tempDir, "ripped.mkv", DateTime.Now);
+            CreateFile(tempDir, "other.mkv", DateTime.Now);
+            var known = new HashSet<string>();
+
+            InvokeRememberRipOutput(tempDir, known, ripped);
+
+            known.Should().BeEquivalentTo(new[] { ripped });
+        }
+        finally
+        {
+            Directory.Delete(tempDir, recursive: true);
+        }
+    }
+
+    [Fact]
+    public void RememberRipOutput_FailedRip_RecordsLeftoverFiles()
+    {
+        var tempDir = Path.Combine(Path.GetTempPath(), $"ripsharp-tests-{Path.GetRandomFileName()}");
+        Directory.CreateDirectory(tempDir);
+
+        try
+        {
+            var partial = CreateFile(tempDir, "partial.mkv", DateTime.Now);
+            var known = new HashSet<string>();
+
+            InvokeRememberRipOutput(tempDir, known, null);
+
+            known.Should().BeEquivalentTo(new[] { partial });
+        }
+        finally
+        {
+            Directory.Delete(tempDir, recursive: true);
+        }
+    }
+
+    private static string CreateFile(string directory, string name, DateTime creationTime)
+    {
+        var path = Path.Combine(directory, name);
+        File.WriteAllText(path, "data");
+        File.SetCreationTime(path, creationTime);
+        return path;
+    }
+
+    private static string? InvokeFindRippedMkv(string directory, int titleId, HashSet<string> excludedPaths)
+    {
+        var method = typeof(DiscRipper)
+            .GetMethod("FindRippedMkv", BindingFlags.NonPublic | BindingFlags.Static);
+
+        method.Should().NotBeNull();
+
+        return (string?)method!.Invoke(null, new object[] { directory, titleId, excludedPaths });
+    }
+
+    private static void InvokeRememberRipOutput(string directory, HashSet<string> knownMkvs, string? rippedPath)
+    {
+        var method = typeof(DiscRipper)
+            .GetMethod("RememberRipOutput", BindingFlags.NonPublic | BindingFlags.Static);
+
+        method.Should().NotBeNull();
+
+        method!.Invoke(null, new object?[] { directory, knownMkvs, rippedPath });
+    }
+}
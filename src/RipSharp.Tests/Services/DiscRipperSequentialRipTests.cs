@@ -0,0 +1,97 @@
+using System.Reflection;
+
+namespace RipSharp.Tests.Services;
+
+public class DiscRipperSequentialRipTests : IDisposable
+{
+    private readonly string _tempDir = Path.Combine(Path.GetTempPath(), $"ripsharp-tests-{Path.GetRandomFileName()}");
+    private readonly DiscInfo _discInfo = new()
+    {
+        Titles = new List<TitleInfo> { new() { Id = 0 }, new() { Id = 1 } }
+    };
+
+    public DiscRipperSequentialRipTests()
+    {
+        Directory.CreateDirectory(_tempDir);
+    }
+
+    public void Dispose()
+    {
+        if (Directory.Exists(_tempDir))
+            Directory.Delete(_tempDir, recursive: true);
+    }
+
+    [Fact]
+    public async Task RipTitlesAsync_UsesOneProgressSessionForAllTitles()
+    {
+        var makeMkv = Substitute.For<IMakeMkvService>();
+        makeMkv.RipTitleAsync(Arg.Any<string>(), Arg.Any<int>(), Arg.Any<string>(), Arg.Any<Action<string>?>(), Arg.Any<Action<string>?>(), Arg.Any<CancellationToken>())
+            .Returns(ci =>
+            {
+                File.WriteAllText(Path.Combine(_tempDir, $"title_t{ci.ArgAt<int>(1):D2}.mkv"), "data");
+                return Task.FromResult(0);
+            });
+        var progressDisplay = CreateProgressDisplay(out var context);
+        var ripper = CreateRipper(makeMkv, progressDisplay);
+
+        var ripped = await InvokeRipTitlesAsync(ripper, _discInfo, new List<int> { 0, 1 }, new RipOptions { Temp = _tempDir }, CancellationToken.None);
+
+        await progressDisplay.Received(1).ExecuteAsync(Arg.Any<Func<IProgressContext, Task>>());
+        context.ReceivedWithAnyArgs(1).AddTask(default!, default);
+        ripped.Should().HaveCount(2);
+        ripped[0].Should().Be(Path.Combine(_tempDir, "title_t00.mkv"));
+        ripped[1].Should().Be(Path.Combine(_tempDir, "title_t01.mkv"));
+    }
+
+    [Fact]
+    public async Task RipTitlesAsync_DoesNotStartAnotherRipAfterCancellation()
+    {
+        using var cts = new CancellationTokenSource();
+        var makeMkv = Substitute.For<IMakeMkvService>();
+        makeMkv.RipTitleAsync(Arg.Any<string>(), Arg.Any<int>(), Arg.Any<string>(), Arg.Any<Action<string>?>(), Arg.Any<Action<string>?>(), Arg.Any<CancellationToken>())
+            .Returns(_ =>
+            {
+                // Simulate Ctrl+C while the first title is ripping
+                cts.Cancel();
+                return Task.FromResult(1);
+            });
+        var ripper = CreateRipper(makeMkv, CreateProgressDisplay(out _));
+
+        var act = () => InvokeRipTitlesAsync(ripper, _discInfo, new List<int> { 0, 1 }, new RipOptions { Temp = _tempDir }, cts.Token);
+
+        await act.Should().ThrowAsync<OperationCanceledException>();
+        await makeMkv.Received(1).RipTitleAsync(Arg.Any<string>(), Arg.Any<int>(), Arg.Any<string>(), Arg.Any<Action<string>?>(), Arg.Any<Action<string>?>(), cts.Token);
+    }
+
+    private static IProgressDisplay CreateProgressDisplay(out IProgressContext context)
+    {
+        var progressDisplay = Substitute.For<IProgressDisplay>();
+        var progressContext = Substitute.For<IProgressContext>();
+        progressContext.AddTask(Arg.Any<string>(), Arg.Any<long>()).Returns(Substitute.For<IProgressTask>());
+        progressDisplay.ExecuteAsync(Arg.Any<Func<IProgressContext, Task>>())
+            .Returns(ci => ci.Arg<Func<IProgressContext, Task>>()(progressContext));
+        context = progressContext;
+        return progressDisplay;
+    }
+
+    private static DiscRipper CreateRipper(IMakeMkvService makeMkv, IProgressDisplay progressDisplay)
+    {
+        var scanner = Substitute.For<IDiscScanner>();
+        var encoder = Substitute.For<IEncoderService>();
+        var metadataService = Substitute.For<IMetadataService>();
+        var notifier = Substitute.For<IConsoleWriter>();
+        var userPrompt = Substitute.For<IUserPrompt>();
+        var episodeTitles = Substitute.For<ITvEpisodeTitleProvider>();
+        var theme = ThemeProvider.CreateDefault();
+
+        return new DiscRipper(scanner, encoder, metadataService, makeMkv, notifier, userPrompt, episodeTitles, progressDisplay, theme);
+    }
+
+    private static async Task<Dictionary<int, string>> InvokeRipTitlesAsync(DiscRipper ripper, DiscInfo discInfo, List<int> titleIds, RipOptions options, CancellationToken cancellationToken)
+    {
+        var method = typeof(DiscRipper).GetMethod("RipTitlesAsync", BindingFlags.NonPublic | BindingFlags.Instance);
+        method.Should().NotBeNull();
+
+        return await (Task<Dictionary<int, string>>)method!.Invoke(ripper, new object[] { discInfo, titleIds, options, cancellationToken })!;
+    }
+}
@@ -32,6 +32,58 @@ public class DiscRipperTitleSuffixTests
         versionSuffix.Should().BeNull();
     }
 
+    [Fact]
+    public async Task BuildTitlePlansAsync_Tv_AssignsEpisodeTitlesInOrder()
+    {
+        var episodeTitles = Substitute.For<ITvEpisodeTitleProvider>();
+        episodeTitles.GetEpisodeTitleAsync("Show", 2, Arg.Any<int>(), null)
+            .Returns(callInfo => Task.FromResult<string?>($"Episode {callInfo.ArgAt<int>(2)}"));
+        var ripper = CreateRipper(Substitute.For<IEncoderService>(), episodeTitles);
+        var discInfo = new DiscInfo
+        {
+            Titles = new List<TitleInfo> { new() { Id = 5 }, new() { Id = 6 }, new() { Id = 7 } }
+        };
+        var metadata = new ContentMetadata { Title = "Show", Type = "tv" };
+        var options = new RipOptions { Output = "/tmp", Tv = true, Season = 2, EpisodeStart = 4 };
+
+        var plans = await InvokeBuildTitlePlansAsync(ripper, discInfo, new List<int> { 5, 6, 7 }, metadata, options);
+
+        plans.Select(p => GetStringProperty(p, "FinalFileName")).Should().Equal(
+            "Show - S02E04 - Episode 4.mkv",
+            "Show - S02E05 - Episode 5.mkv",
+            "Show - S02E06 - Episode 6.mkv");
+    }
+
+    [Fact]
+    public async Task BuildTitlePlansAsync_Tv_FirstLookupReturnsNull_LooksUpEveryEpisodeWithBoundedConcurrency()
+    {
+        var inFlight = 0;
+        var maxInFlight = 0;
+        var episodeTitles = Substitute.For<ITvEpisodeTitleProvider>();
+        episodeTitles.GetEpisodeTitleAsync("Show", 1, Arg.Any<int>(), null)
+            .Returns(async callInfo =>
+            {
+                var current = Interlocked.Increment(ref inFlight);
+                InterlockedMax(ref maxInFlight, current);
+                await Task.Delay(20);
+                Interlocked.Decrement(ref inFlight);
+                var episode = callInfo.ArgAt<int>(2);
+                return episode == 1 ? null : $"Episode {episode}";
+            });
+        var ripper = CreateRipper(Substitute.For<IEncoderService>(), episodeTitles);
+        var titleIds = Enumerable.Range(0, 12).ToList();
+        var discInfo = new DiscInfo { Titles = titleIds.Select(id => new TitleInfo { Id = id }).ToList() };
+        var metadata = new ContentMetadata { Title = "Show", Type = "tv" };
+        var options = new RipOptions { Output = "/tmp", Tv = true, Season = 1, EpisodeStart = 1 };
+
+        var plans = await InvokeBuildTitlePlansAsync(ripper, discInfo, titleIds, metadata, options);
+
+        await episodeTitles.ReceivedWithAnyArgs(12).GetEpisodeTitleAsync(default!, default, default, default);
+        maxInFlight.Should().BeInRange(1, 4);
+        GetStringProperty(plans[0], "FinalFileName").Should().Be("Show - S01E01.mkv");
+        GetStringProperty(plans[11], "FinalFileName").Should().Be("Show - S01E12 - Episode 12.mkv");
+    }
+
     [Fact]
     public async Task EncodeAndRenameAsync_SingleMovieTitle_DoesNotAppendSuffix()
     {
@@ -49,7 +101,9 @@ public class DiscRipperTitleSuffixTests
                     Arg.Any<bool>(),
                     Arg.Any<int>(),
                     Arg.Any<int>(),
-                    Arg.Any<IProgressTask?>())
+                    Arg.Any<IProgressTask?>(),
+                    Arg.Any<int>(),
+                    Arg.Any<CancellationToken>())
                 .Returns(callInfo =>
                 {
                     var outputPath = callInfo.ArgAt<string>(1);
@@ -83,14 +137,14 @@ public class DiscRipperTitleSuffixTests
         }
     }
 
-    private static DiscRipper CreateRipper(IEncoderService encoder)
+    private static DiscRipper CreateRipper(IEncoderService encoder, ITvEpisodeTitleProvider? episodeTitles = null)
     {
         var scanner = Substitute.For<IDiscScanner>();
         var metadataService = Substitute.For<IMetadataService>();
         var makeMkv = Substitute.For<IMakeMkvService>();
         var notifier = Substitute.For<IConsoleWriter>();
         var userPrompt = Substitute.For<IUserPrompt>();
-        var episodeTitles = Substitute.For<ITvEpisodeTitleProvider>();
+        episodeTitles ??= Substitute.For<ITvEpisodeTitleProvider>();
         var progressDisplay = Substitute.For<IProgressDisplay>();
         var theme = ThemeProvider.CreateDefault();
 
@@ -125,12 +179,18 @@ public class DiscRipperTitleSuffixTests
         var method = typeof(DiscRipper).GetMethod("EncodeAndRenameAsync", BindingFlags.NonPublic | BindingFlags.Instance);
         method.Should().NotBeNull();
 
-        var task = (Task)method!.Invoke(ripper, new object[] { discInfo, titleIds, rippedFilesMap, metadata, options })!;
+        var task = (Task)method!.Invoke(ripper, new object[] { discInfo, titleIds, rippedFilesMap, metadata, options, CancellationToken.None })!;
         await task.ConfigureAwait(false);
 
         return (List<string>)task.GetType().GetProperty("Result")!.GetValue(task)!;
     }
 
+    private static void InterlockedMax(ref int target, int value)
+    {
+        int current;
+        while (value > (current = Volatile.Read(ref target)) && Interlocked.CompareExchange(ref target, value, current) != current) { }
+    }
+
     private static string? GetStringProperty(object target, string propertyName)
     {
         return target.GetType().GetProperty(propertyName, BindingFlags.Public | BindingFlags.Instance)?.GetValue(target) as string;
@@ -0,0 +1,45 @@
+namespace RipSharp.Tests.Services;
+
+public class DiscScannerTests
+{
+    private static readonly DiscInfo Disc = new()
+    {
+        Titles = new List<TitleInfo>
+        {
+            new() { Id = 4, DurationSeconds = 45 * 60 },
+            new() { Id = 0, DurationSeconds = 2 * 60 * 60 },
+            new() { Id = 2, DurationSeconds = 22 * 60 },
+            new() { Id = 1, DurationSeconds = 5 * 60 },
+            new() { Id = 3, DurationSeconds = 30 * 60 - 1 },
+        }
+    };
+
+    [Fact]
+    public void IdentifyMainContent_Tv_ReturnsSortedEpisodeLengthTitles()
+    {
+        var scanner = CreateScanner();
+
+        var ids = scanner.IdentifyMainContent(Disc, isTv: true);
+
+        ids.Should().Equal(2, 3, 4);
+    }
+
+    [Fact]
+    public void IdentifyMainContent_Movie_ReturnsSortedTitlesOfAtLeastThirtyMinutes()
+    {
+        var scanner = CreateScanner();
+
+        var ids = scanner.IdentifyMainContent(Disc, isTv: false);
+
+        ids.Should().Equal(0, 4);
+    }
+
+    private static DiscScanner CreateScanner()
+    {
+        return new DiscScanner(
+            Substitute.For<IProcessRunner>(),
+            Substitute.For<IConsoleWriter>(),
+            Substitute.For<IDiscTypeDetector>(),
+            ThemeProvider.CreateDefault());
+    }
+}
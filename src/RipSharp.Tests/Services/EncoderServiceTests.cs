@@ -0,0 +1,165 @@
+using System.Text;
+
+namespace RipSharp.Tests.Services;
+
+public class EncoderServiceTests
+{
+    private const string ProbeJson = @"{
+  ""streams"": [
+    { ""index"": 0, ""codec_type"": ""video"", ""codec_name"": ""h264"", ""width"": 1920, ""height"": 1080 },
+    { ""index"": 1, ""codec_type"": ""audio"", ""codec_name"": ""ac3"", ""channels"": 6, ""tags"": { ""language"": ""eng"" } },
+    { ""index"": 2, ""codec_type"": ""subtitle"", ""codec_name"": ""hdmv_pgs_subtitle"", ""tags"": { ""language"": ""fre"" } }
+  ],
+  ""format"": { ""duration"": ""5400.250000"" }
+}";
+
+    [Fact]
+    public async Task AnalyzeAsync_ParsesStreamsAndDuration()
+    {
+        var runner = CreateRunner(ProbeJson, exitCode: 0);
+        var encoder = CreateEncoder(runner);
+
+        var result = await encoder.AnalyzeAsync("/tmp/movie.mkv");
+
+        result.Should().NotBeNull();
+        result!.DurationSeconds.Should().Be(5400.25);
+        result.Streams.Select(s => s.CodecType).Should().Equal("video", "audio", "subtitle");
+        result.Streams[0].Width.Should().Be(1920);
+        result.Streams[1].Channels.Should().Be(6);
+        result.Streams[1].Language.Should().Be("eng");
+        result.Streams[2].Language.Should().Be("fre");
+        await runner.Received(1).RunWithOutputStreamAsync("ffprobe", Arg.Is<string>(a => a.Contains("-show_entries format=duration:stream=") && !a.Contains("-show_streams")),
+            Arg.Any<Func<Stream, Task>>(), Arg.Any<Action<string>?>(), Arg.Any<CancellationToken>());
+    }
+
+    [Fact]
+    public async Task AnalyzeAsync_ReturnsNull_WhenProbeFailsWithoutOutput()
+    {
+        var runner = CreateRunner(string.Empty, exitCode: 1);
+        var encoder = CreateEncoder(runner);
+
+        var result = await encoder.AnalyzeAsync("/tmp/missing.mkv");
+
+        result.Should().BeNull();
+    }
+
+    [Fact]
+    public async Task EncodeAsync_MapsVideoAndEnglishTracksOnly()
+    {
+        var runner = CreateRunner(ProbeJson, exitCode: 0);
+        string? ffmpegArgs = null;
+        runner.RunAsync("ffmpeg", Arg.Do<string>(a => ffmpegArgs = a), Arg.Any<Action<string>?>(), Arg.Any<Action<string>?>(), Arg.Any<CancellationToken>())
+            .Returns(Task.FromResult(0));
+        var encoder = CreateEncoder(runner);
+
+        var success = await encoder.EncodeAsync("/tmp/in.mkv", "/tmp/out.mkv", includeEnglishSubtitles: true, ordinal: 1, total: 1);
+
+        success.Should().BeTrue();
+        ffmpegArgs.Should().Contain("-map 0:0 -map 0:1 -map_chapters 0");
+        ffmpegArgs.Should().NotContain("-map 0:2");
+        ffmpegArgs.Should().Contain("-sn");
+    }
+
+    [Fact]
+    public async Task EncodeAsync_MapsWholeInput_WhenEveryStreamIsKept()
+    {
+        var runner = CreateRunner(ProbeJson.Replace("\"fre\"", "\"eng\""), exitCode: 0);
+        string? ffmpegArgs = null;
+        runner.RunAsync("ffmpeg", Arg.Do<string>(a => ffmpegArgs = a), Arg.Any<Action<string>?>(), Arg.Any<Action<string>?>(), Arg.Any<CancellationToken>())
+            .Returns(Task.FromResult(0));
+        var encoder = CreateEncoder(runner);
+
+        await encoder.EncodeAsync("/tmp/in.mkv", "/tmp/out.mkv", includeEnglishSubtitles: true, ordinal: 1, total: 1);
+
+        ffmpegArgs.Should().Contain("-map 0 -map_chapters 0");
+        ffmpegArgs.Should().NotContain("-map 0:");
+        ffmpegArgs.Should().Contain("-c:s:0 copy");
+    }
+
+    [Theory]
+    [InlineData(0, false)]
+    [InlineData(4, true)]
+    public async Task EncodeAsync_PassesThreadLimitOnlyWhenGiven(int threads, bool expectThreadsArg)
+    {
+        var runner = CreateRunner(ProbeJson, exitCode: 0);
+        string? ffmpegArgs = null;
+        runner.RunAsync("ffmpeg", Arg.Do<string>(a => ffmpegArgs = a), Arg.Any<Action<string>?>(), Arg.Any<Action<string>?>(), Arg.Any<CancellationToken>())
+            .Returns(Task.FromResult(0));
+        var encoder = CreateEncoder(runner);
+
+        await encoder.EncodeAsync("/tmp/in.mkv", "/tmp/out.mkv", includeEnglishSubtitles: true, ordinal: 1, total: 1, threads: threads);
+
+        if (expectThreadsArg)
+            ffmpegArgs.Should().Contain($"-threads {threads} ");
+        else
+            ffmpegArgs.Should().NotContain("-threads");
+    }
+
+    [Fact]
+    public async Task EncodeAsync_WithAnalysis_SkipsProbe()
+    {
+        var runner = CreateRunner(ProbeJson, exitCode: 0);
+        runner.RunAsync("ffmpeg", Arg.Any<string>(), Arg.Any<Action<string>?>(), Arg.Any<Action<string>?>(), Arg.Any<CancellationToken>())
+            .Returns(Task.FromResult(0));
+        var encoder = CreateEncoder(runner);
+        var analysis = await encoder.AnalyzeAsync("/tmp/in.mkv");
+        runner.ClearReceivedCalls();
+
+        var success = await encoder.EncodeAsync(analysis!, "/tmp/in.mkv", "/tmp/out.mkv", includeEnglishSubtitles: true, ordinal: 1, total: 1);
+
+        success.Should().BeTrue();
+        await runner.DidNotReceiveWithAnyArgs().RunWithOutputStreamAsync(default!, default!, default!, default, default);
+        await runner.Received(1).RunAsync("ffmpeg", Arg.Any<string>(), Arg.Any<Action<string>?>(), Arg.Any<Action<string>?>(), Arg.Any<CancellationToken>());
+    }
+
+    [Fact]
+    public async Task EncodeAsync_OnFailure_ReportsOnlyTheLastDiagnosticLines()
+    {
+        var runner = CreateRunner(ProbeJson, exitCode: 0);
+        runner.RunAsync("ffmpeg", Arg.Any<string>(), Arg.Any<Action<string>?>(), Arg.Any<Action<string>?>(), Arg.Any<CancellationToken>())
+            .Returns(ci =>
+            {
+                var onError = ci.ArgAt<Action<string>?>(3)!;
+                for (var i = 1; i <= 12; i++)
+                {
+                    onError("out_time_us=1000000");
+                    onError($"[matroska @ 0x1] warning {i}");
+                }
+                return Task.FromResult(1);
+            });
+        var notifier = Substitute.For<IConsoleWriter>();
+        var encoder = new EncoderService(runner, notifier, Substitute.For<IProgressDisplay>());
+
+        var success = await encoder.EncodeAsync("/tmp/in.mkv", "/tmp/out.mkv", includeEnglishSubtitles: true, ordinal: 1, total: 1);
+
+        success.Should().BeFalse();
+        notifier.Received(1).Error("ffmpeg exited with code 1 while encoding in.mkv");
+        notifier.DidNotReceive().Error("[matroska @ 0x1] warning 2");
+        notifier.Received(1).Error("[matroska @ 0x1] warning 3");
+        notifier.Received(1).Error("[matroska @ 0x1] warning 12");
+        notifier.DidNotReceive().Error("out_time_us=1000000");
+    }
+
+    private static IProcessRunner CreateRunner(string stdout, int exitCode)
+    {
+        var runner = Substitute.For<IProcessRunner>();
+        runner.RunWithOutputStreamAsync(
+                "ffprobe",
+                Arg.Any<string>(),
+                Arg.Any<Func<Stream, Task>>(),
+                Arg.Any<Action<string>?>(),
+                Arg.Any<CancellationToken>())
+            .Returns(async callInfo =>
+            {
+                var readOutput = callInfo.ArgAt<Func<Stream, Task>>(2);
+                await readOutput(new MemoryStream(Encoding.UTF8.GetBytes(stdout)));
+                return exitCode;
+            });
+        return runner;
+    }
+
+    private static EncoderService CreateEncoder(IProcessRunner runner)
+    {
+        return new EncoderService(runner, Substitute.For<IConsoleWriter>(), Substitute.For<IProgressDisplay>());
+    }
+}
@@ -25,6 +25,14 @@ public class FileNamingTests
         result.Should().Be(expected);
     }
 
+    [Fact]
+    public void SanitizeFileName_KeepsValidCharactersInOrder()
+    {
+        var result = FileNaming.SanitizeFileName(" AC/DC Live at Donington\0 ");
+
+        result.Should().Be("ACDC Live at Donington");
+    }
+
     [Fact]
     public void RenameFile_IncludesSpaceBeforeSuffix()
     {
@@ -68,4 +76,29 @@ public class FileNamingTests
             if (result != null && File.Exists(result)) File.Delete(result);
         }
     }
+
+    [Fact]
+    public void RenameFile_ReplacesExistingDestination()
+    {
+        var directory = Path.Combine(Path.GetTempPath(), $"ripsharp-tests-{Path.GetRandomFileName()}");
+        Directory.CreateDirectory(directory);
+        var source = Path.Combine(directory, "temp.mkv");
+        var destination = Path.Combine(directory, "Control (2007).mkv");
+        File.WriteAllText(source, "new");
+        File.WriteAllText(destination, "old");
+        var metadata = new ContentMetadata { Title = "Control", Year = 2007, Type = "movie" };
+
+        try
+        {
+            var result = FileNaming.RenameFile(source, metadata, null, 1);
+
+            result.Should().Be(destination);
+            File.ReadAllText(destination).Should().Be("new");
+            File.Exists(source).Should().BeFalse();
+        }
+        finally
+        {
+            Directory.Delete(directory, recursive: true);
+        }
+    }
 }
@@ -65,6 +65,34 @@ public class SpectreProgressDisplayTests
         GetElapsed(task).Should().BeCloseTo(firstStopTime - startTime, precision: TimeSpan.FromSeconds(0.25));
     }
 
+    [Fact]
+    public void AddMessage_RetainsOnlyRecentHistory()
+    {
+        var task = (IProgressTask)CreateLiveTask("Test", 100);
+
+        for (var i = 0; i < 500; i++)
+        {
+            task.AddMessage($"line {i}");
+        }
+
+        task.GetRecentMessages(3).Should().Equal("line 497", "line 498", "line 499");
+        task.GetRecentMessages(1000).Should().HaveCountLessThan(500);
+    }
+
+    [Fact]
+    public void Version_ChangesOnlyWhenTaskStateChanges()
+    {
+        var task = (IProgressTask)CreateLiveTask("Test", 100);
+
+        task.Value = 10;
+        var afterFirstUpdate = GetVersion(task);
+        task.Value = 10;
+        GetVersion(task).Should().Be(afterFirstUpdate);
+
+        task.AddMessage("Ripping title 1");
+        GetVersion(task).Should().BeGreaterThan(afterFirstUpdate);
+    }
+
     private static string InvokeFormatTimeSpan(TimeSpan value)
     {
         var method = typeof(SpectreProgressDisplay)
@@ -98,6 +126,14 @@ public class SpectreProgressDisplayTests
         property!.SetValue(task, value);
     }
 
+    private static int GetVersion(object task)
+    {
+        var property = task.GetType().GetProperty("Version", BindingFlags.Public | BindingFlags.Instance);
+
+        property.Should().NotBeNull();
+        return (int)property!.GetValue(task)!;
+    }
+
     private static TimeSpan GetElapsed(object task)
     {
         var method = task.GetType().GetMethod("GetElapsed", BindingFlags.Public | BindingFlags.Instance);
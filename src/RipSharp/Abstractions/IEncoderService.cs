@@ -3,5 +3,6 @@ namespace BugZapperLabs.RipSharp.Abstractions;
 public interface IEncoderService
 {
     Task<MediaFileAnalysis?> AnalyzeAsync(string filePath);
-    Task<bool> EncodeAsync(string inputFile, string outputFile, bool includeEnglishSubtitles, int ordinal, int total, IProgressTask? progressTask = null);
+    Task<bool> EncodeAsync(string inputFile, string outputFile, bool includeEnglishSubtitles, int ordinal, int total, IProgressTask? progressTask = null, int threads = 0, CancellationToken ct = default);
+    Task<bool> EncodeAsync(MediaFileAnalysis analysis, string inputFile, string outputFile, bool includeEnglishSubtitles, int ordinal, int total, IProgressTask? progressTask = null, int threads = 0, CancellationToken ct = default);
 }
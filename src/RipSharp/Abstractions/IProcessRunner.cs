@@ -5,4 +5,8 @@ public interface IProcessRunner
     Task<int> RunAsync(string fileName, string arguments,
         Action<string>? onOutput = null, Action<string>? onError = null,
         CancellationToken ct = default);
+
+    Task<int> RunWithOutputStreamAsync(string fileName, string arguments,
+        Func<Stream, Task> readOutput, Action<string>? onError = null,
+        CancellationToken ct = default);
 }
@@ -0,0 +1,6 @@
+namespace BugZapperLabs.RipSharp.Abstractions;
+
+public interface IToolPathResolver
+{
+    string? Resolve(string tool);
+}
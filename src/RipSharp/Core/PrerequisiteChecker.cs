@@ -8,13 +8,19 @@ internal static class PrerequisiteChecker
         "ffmpeg"
     };
 
+    internal static IReadOnlyList<string> GetMissingTools(IToolPathResolver resolver)
+    {
+        return RequiredTools.Where(tool => resolver.Resolve(tool) == null).ToList();
+    }
+
     internal static IReadOnlyList<string> GetMissingTools(string? pathValue, bool isWindows, Func<string, bool> fileExists)
     {
         var missing = new List<string>();
+        var directories = GetSearchDirectories(pathValue);
 
         foreach (var tool in RequiredTools)
         {
-            if (!IsToolAvailable(tool, pathValue, isWindows, fileExists))
+            if (ResolveToolPath(tool, directories, isWindows, fileExists) == null)
             {
                 missing.Add(tool);
             }
@@ -23,32 +29,46 @@ internal static class PrerequisiteChecker
         return missing;
     }
 
-    internal static bool IsToolAvailable(string tool, string? pathValue, bool isWindows, Func<string, bool> fileExists)
+    internal static string? ResolveToolPath(string tool, string? pathValue, bool isWindows, Func<string, bool> fileExists)
+    {
+        return ResolveToolPath(tool, GetSearchDirectories(pathValue), isWindows, fileExists);
+    }
+
+    private static string? ResolveToolPath(string tool, IReadOnlyList<string> directories, bool isWindows, Func<string, bool> fileExists)
+    {
+        foreach (var dir in directories)
+        {
+            foreach (var candidate in GetExecutableCandidates(tool, isWindows))
+            {
+                var fullPath = Path.Combine(dir, candidate);
+                if (fileExists(fullPath))
+                {
+                    return fullPath;
+                }
+            }
+        }
+
+        return null;
+    }
+
+    private static IReadOnlyList<string> GetSearchDirectories(string? pathValue)
     {
         if (string.IsNullOrWhiteSpace(pathValue))
         {
-            return false;
+            return Array.Empty<string>();
         }
 
+        var directories = new List<string>();
         foreach (var dir in pathValue.Split(Path.PathSeparator, StringSplitOptions.RemoveEmptyEntries))
         {
             var trimmed = dir.Trim().Trim('"');
-            if (string.IsNullOrWhiteSpace(trimmed))
-            {
-                continue;
-            }
-
-            foreach (var candidate in GetExecutableCandidates(tool, isWindows))
+            if (!string.IsNullOrWhiteSpace(trimmed))
             {
-                var fullPath = Path.Combine(trimmed, candidate);
-                if (fileExists(fullPath))
-                {
-                    return true;
-                }
+                directories.Add(trimmed);
             }
         }
 
-        return false;
+        return directories;
     }
 
     private static IEnumerable<string> GetExecutableCandidates(string tool, bool isWindows)
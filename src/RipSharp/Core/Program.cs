@@ -1,3 +1,4 @@
+using System.Net;
 using System.Reflection;
 
 using Microsoft.Extensions.Configuration;
@@ -50,10 +51,8 @@ public class Program
             return 0;
         }
 
-        var missingTools = PrerequisiteChecker.GetMissingTools(
-            Environment.GetEnvironmentVariable("PATH"),
-            OperatingSystem.IsWindows(),
-            File.Exists);
+        var toolPaths = new ToolPathResolver();
+        var missingTools = PrerequisiteChecker.GetMissingTools(toolPaths);
 
         if (missingTools.Count > 0)
         {
@@ -101,9 +100,10 @@ public class Program
                     File.WriteAllText,
                     path => Directory.CreateDirectory(path));
 
+                // Options are read once per run, so don't start a file watcher for each YAML file
                 if (!string.IsNullOrWhiteSpace(configPath))
                 {
-                    cfg.AddYamlFile(configPath, optional: false, reloadOnChange: true);
+                    cfg.AddYamlFile(configPath, optional: false, reloadOnChange: false);
                 }
 
                 ThemeFileLocator.EnsureBundledThemeFiles(
@@ -122,7 +122,7 @@ public class Program
 
                 if (!string.IsNullOrWhiteSpace(resolvedThemePath))
                 {
-                    cfg.AddYamlFile(resolvedThemePath, optional: true, reloadOnChange: true);
+                    cfg.AddYamlFile(resolvedThemePath, optional: true, reloadOnChange: false);
                 }
 
                 cfg.AddEnvironmentVariables();
@@ -135,6 +135,7 @@ public class Program
                 services.AddSingleton<IConsoleWriter, ConsoleWriter>();
                 services.AddSingleton<IProgressDisplay, SpectreProgressDisplay>();
                 services.AddSingleton<IUserPrompt, ConsoleUserPrompt>();
+                services.AddSingleton<IToolPathResolver>(toolPaths);
                 services.AddSingleton<IProcessRunner, ProcessRunner>();
                 services.AddSingleton<IMakeMkvService, MakeMkvService>();
                 services.AddSingleton<IDiscScanner, DiscScanner>();
@@ -145,10 +146,25 @@ public class Program
                 var tmdbKey = Environment.GetEnvironmentVariable("TMDB_API_KEY");
                 var tvdbKey = Environment.GetEnvironmentVariable("TVDB_API_KEY");
 
+                // One pooled client for every provider, so lookups reuse open connections instead of a new TLS handshake each.
+                // The JSON responses compress well, so ask for gzip/brotli. The host disposes the client on shutdown.
+                services.AddSingleton(_ => new HttpClient(new SocketsHttpHandler
+                {
+                    PooledConnectionLifetime = TimeSpan.FromMinutes(5),
+                    AutomaticDecompression = DecompressionMethods.All
+                }));
+
+                // A single TVDB instance serves both series lookup and episode titles, sharing its token and series cache
+                if (!string.IsNullOrWhiteSpace(tvdbKey))
+                {
+                    services.AddSingleton(sp => new TvdbMetadataProvider(
+                        sp.GetRequiredService<HttpClient>(), tvdbKey, sp.GetRequiredService<IConsoleWriter>()));
+                }
+
                 services.AddSingleton<IEnumerable<IMetadataProvider>>(sp =>
                 {
                     var notifier = sp.GetRequiredService<IConsoleWriter>();
-                    var httpClient = new HttpClient();
+                    var httpClient = sp.GetRequiredService<HttpClient>();
                     var providers = new List<IMetadataProvider>();
 
                     if (!string.IsNullOrWhiteSpace(omdbKey))
@@ -156,16 +172,23 @@ public class Program
                     if (!string.IsNullOrWhiteSpace(tmdbKey))
                         providers.Add(new TmdbMetadataProvider(httpClient, tmdbKey, notifier));
                     if (!string.IsNullOrWhiteSpace(tvdbKey))
-                        providers.Add(new TvdbMetadataProvider(httpClient, tvdbKey, notifier));
+                        providers.Add(sp.GetRequiredService<TvdbMetadataProvider>());
+
+                    // Remember successful lookups on disk so re-ripping a disc skips the online queries
+                    var cachePath = MetadataCache.GetDefaultPath();
+                    if (cachePath != null)
+                    {
+                        var cache = new MetadataCache(cachePath);
+                        return providers.Select(p => (IMetadataProvider)new CachingMetadataProvider(p, cache)).ToList();
+                    }
 
                     return providers;
                 });
 
                 services.AddSingleton<ITvEpisodeTitleProvider>(sp =>
                 {
-                    var notifier = sp.GetRequiredService<IConsoleWriter>();
                     if (!string.IsNullOrWhiteSpace(tvdbKey))
-                        return new TvdbMetadataProvider(new HttpClient(), tvdbKey, notifier);
+                        return sp.GetRequiredService<TvdbMetadataProvider>();
                     return new NullEpisodeTitleProvider();
                 });
 
@@ -17,6 +17,7 @@ public class RipOptions
     public bool ShowVersion { get; set; }
     public bool TempWasAutoGenerated { get; set; }
     public bool EnableParallelProcessing { get; set; } = true; // Enable parallel rip and encode by default
+    public int EncodeJobs { get; set; } = 1; // Number of ffmpeg encodes allowed to run at once
 
     public static RipOptions ParseArgs(string[] args)
     {
@@ -73,6 +74,7 @@ public class RipOptions
                 case "--debug": opts.Debug = true; break;
                 case "--disc-type": opts.DiscType = next(); break;
                 case "--sequential": opts.EnableParallelProcessing = false; break;
+                case "--encode-jobs": if (int.TryParse(next(), out var j) && j > 0) opts.EncodeJobs = j; break;
             }
         }
         if (string.IsNullOrWhiteSpace(opts.Output))
@@ -131,7 +133,10 @@ public class RipOptions
         OptionDetail("Default: auto-detect");
         OptionLine("--sequential", "Disable parallel processing");
         OptionDetail("Rip all, then encode all");
+        OptionLine("--encode-jobs N", "Concurrent encodes (default: 1)");
+        OptionDetail("In the default pipeline or with --sequential");
         OptionLine("--debug", "Enable debug logging");
+        OptionDetail("Writes per-title MakeMKV progress logs to the temp dir");
         OptionLine("-h, --help", "Show this help message");
         OptionLine("-v, --version", "Show the application version");
         writer.Plain("");
@@ -2,21 +2,33 @@ using System.Text.RegularExpressions;
 
 namespace BugZapperLabs.RipSharp.MakeMkv;
 
-public class MakeMkvOutputHandler
+public class MakeMkvOutputHandler : IDisposable
 {
+    // PRGV arrives many times per second during a rip; compile the pattern once
+    private static readonly Regex ProgressValueRegex = new(@"PRGV:\s*([0-9]+(?:\.[0-9]+)?)", RegexOptions.Compiled);
+
     private readonly long _expectedBytes;
     private readonly int _index;
     private readonly int _totalTitles;
     private readonly IProgressTask? _task;
-    private readonly string _progressLogPath;
-    private readonly string _rawLogPath;
+    private readonly string? _progressLogPath;
+    private readonly string? _rawLogPath;
     private readonly IConsoleWriter _writer;
     private readonly IThemeProvider _theme;
 
+    // makemkvcon repeats the same caption many times; only push changes to the display.
+    // The task's value is driven by the caller's poll loop on its own scale, so only captions go to it here.
+    private string? _lastCaption;
+
+    // Debug logs stay open for the whole rip instead of being reopened for every line; keyed by path.
+    // stdout and stderr lines arrive on different threads, so writes are serialized.
+    private readonly Dictionary<string, StreamWriter?> _logWriters = new();
+    private readonly object _logLock = new();
+
     public double LastBytesProcessed { get; private set; }
     public double LastProgressFraction { get; private set; }
 
-    public MakeMkvOutputHandler(long expectedBytes, int index, int totalTitles, IProgressTask? task, string progressLogPath, string rawLogPath, IConsoleWriter writer, IThemeProvider theme)
+    public MakeMkvOutputHandler(long expectedBytes, int index, int totalTitles, IProgressTask? task, string? progressLogPath, string? rawLogPath, IConsoleWriter writer, IThemeProvider theme)
     {
         _expectedBytes = expectedBytes;
         _index = index;
@@ -30,11 +42,13 @@ public class MakeMkvOutputHandler
 
     public void HandleLine(string line)
     {
-        TryAppend(_rawLogPath, line + "\n");
-        if (line.StartsWith("PRGV:"))
+        if (_rawLogPath != null)
+            TryAppend(_rawLogPath, line + "\n");
+        var prefix = MakeMkvProtocol.GetPrefix(line);
+        if (prefix is "PRGV")
         {
-            var m = Regex.Match(line, @"PRGV:\s*([0-9]+(?:\.[0-9]+)?)");
-            if (m.Success && double.TryParse(m.Groups[1].Value, out var raw))
+            var m = ProgressValueRegex.Match(line);
+            if (m.Success && double.TryParse(m.Groups[1].ValueSpan, out var raw))
             {
                 double bytesProcessed = raw;
                 double fraction = 0;
@@ -71,34 +85,59 @@ public class MakeMkvOutputHandler
                 }
 
                 LastProgressFraction = fraction;
-                if (_task != null)
-                    _task.Value = (long)bytesProcessed;
                 LastBytesProcessed = bytesProcessed;
-                TryAppend(_progressLogPath, $"PRGV {bytesProcessed:F0}\n");
+                if (_progressLogPath != null)
+                    TryAppend(_progressLogPath, $"PRGV {bytesProcessed:F0}\n");
             }
         }
-        else if (line.StartsWith("PRGC:"))
+        else if (prefix is "PRGC")
         {
             var caption = MakeMkvProtocol.ExtractQuoted(line);
-            if (!string.IsNullOrEmpty(caption))
+            if (!string.IsNullOrEmpty(caption) && caption != _lastCaption)
             {
+                _lastCaption = caption;
                 if (_task != null)
                     _task.Description = $"[{_theme.Colors.Success}]{caption} ({_index + 1}/{_totalTitles})[/]";
             }
-            TryAppend(_progressLogPath, $"PRGC {caption}\n");
+            if (_progressLogPath != null)
+                TryAppend(_progressLogPath, $"PRGC {caption}\n");
         }
     }
 
     private void TryAppend(string path, string content)
     {
-        try
+        lock (_logLock)
         {
-            File.AppendAllText(path, content);
+            try
+            {
+                if (!_logWriters.TryGetValue(path, out var logWriter))
+                {
+                    // Shared so the log can be tailed while the rip runs; flushed per line so nothing is lost if the process dies
+                    logWriter = new StreamWriter(new FileStream(path, FileMode.Append, FileAccess.Write, FileShare.ReadWrite)) { AutoFlush = true };
+                    _logWriters[path] = logWriter;
+                }
+                logWriter?.Write(content);
+            }
+            catch (Exception ex) when (ex is IOException or UnauthorizedAccessException)
+            {
+                // Best-effort logging: do not rethrow, but make failures visible (once per log, not once per line)
+                _writer.Error($"Failed to append to log file '{path}': {ex.Message}");
+                if (_logWriters.TryGetValue(path, out var failed))
+                {
+                    try { failed?.Dispose(); } catch (IOException) { }
+                }
+                _logWriters[path] = null;
+            }
         }
-        catch (Exception ex)
+    }
+
+    public void Dispose()
+    {
+        lock (_logLock)
         {
-            // Best-effort logging: do not rethrow, but make failures visible.
-            _writer.Error($"Failed to append to log file '{path}': {ex.Message}");
+            foreach (var logWriter in _logWriters.Values)
+                logWriter?.Dispose();
+            _logWriters.Clear();
         }
     }
 }
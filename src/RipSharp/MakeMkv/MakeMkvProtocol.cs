@@ -1,13 +1,29 @@
-using System.Text.RegularExpressions;
-
 namespace BugZapperLabs.RipSharp.MakeMkv;
 
 public static class MakeMkvProtocol
 {
-    // Extract the first quoted string from a line like: MSG:1005,0,0,"Some message"
+    // Extract the first non-empty quoted string from a line like: MSG:1005,0,0,"Some message"
+    // A plain quote scan: this runs for most CINFO/TINFO/MSG lines, and a regex buys nothing here
     public static string? ExtractQuoted(string line)
     {
-        var m = Regex.Match(line, "\"([^\"]+)\"");
-        return m.Success ? m.Groups[1].Value : null;
+        var open = line.IndexOf('"');
+        while (open >= 0)
+        {
+            var close = line.IndexOf('"', open + 1);
+            if (close < 0) return null;
+            if (close > open + 1) return line.Substring(open + 1, close - open - 1);
+            open = close; // skip an empty "" pair, as the closing quote may open the next value
+        }
+        return null;
     }
+
+    // Robot-mode lines are "<PREFIX>:<payload>"; returns the prefix, or an empty span when there is none
+    public static ReadOnlySpan<char> GetPrefix(string line)
+    {
+        var colon = line.IndexOf(':');
+        return colon > 0 ? line.AsSpan(0, colon) : ReadOnlySpan<char>.Empty;
+    }
+
+    // PRGV/PRGC lines carry rip progress and are handled by MakeMkvOutputHandler, not shown to the user
+    public static bool IsProgressLine(string line) => GetPrefix(line) is "PRGV" or "PRGC";
 }
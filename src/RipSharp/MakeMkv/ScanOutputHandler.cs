@@ -4,9 +4,17 @@ namespace BugZapperLabs.RipSharp.MakeMkv;
 
 public class ScanOutputHandler
 {
+    // TINFO:<title id>,<attribute id>,<code>,"<value>" - id, attribute and value captured in one match
+    private static readonly Regex TitleInfoRegex = new(@"^TINFO:(?<id>\d+),(?<field>\d+),(?:\d+,""(?<value>[^""]*)"")?", RegexOptions.Compiled);
+    private static readonly Regex AddedFileRegex = new(@"""File ([^\s]+)", RegexOptions.Compiled);
+    private static readonly Regex AddedTitleNumberRegex = new(@"title #(\d+)", RegexOptions.Compiled);
+    private static readonly Regex DuplicateTitleRegex = new(@"""Title ([^\s]+) is equal", RegexOptions.Compiled);
+    private static readonly Regex ShortTitleRegex = new(@"""Title #([^\s]+)", RegexOptions.Compiled);
+
     private readonly IConsoleWriter _notifier;
     private readonly IThemeProvider _theme;
     private readonly List<TitleInfo> _titles;
+    private readonly Dictionary<int, TitleInfo> _titlesById = new();
     private string? _discName;
     private string? _discType;
 
@@ -20,6 +28,8 @@ public class ScanOutputHandler
         _notifier = notifier;
         _theme = theme;
         _titles = titles;
+        foreach (var title in titles)
+            _titlesById.TryAdd(title.Id, title); // first entry wins, as in DiscInfo.TitlesById
     }
 
     public string? DiscName => _discName;
@@ -28,166 +38,183 @@ public class ScanOutputHandler
 
     public void HandleLine(string line)
     {
+        // Find the prefix once and dispatch on it
+        var prefix = MakeMkvProtocol.GetPrefix(line);
+        if (prefix.IsEmpty) return;
+
         // Handle UI messages first
-        HandleProgressMessages(line);
+        HandleProgressMessages(prefix, line);
 
         // Then parse protocol data
-        ParseProtocolData(line);
+        ParseProtocolData(prefix, line);
     }
 
-    private void HandleProgressMessages(string line)
+    private void HandleProgressMessages(ReadOnlySpan<char> prefix, string line)
     {
-        if (line.StartsWith("MSG:") && line.Contains("insert disc"))
-        {
-            _notifier.Warning($"{_theme.Emojis.InsertDisc} Insert a disc into the drive...");
-        }
-        else if (line.StartsWith("DRV:0,") && !line.Contains(",256,") && !_discDetectedPrinted)
-        {
-            _notifier.Success($"{_theme.Emojis.DiscDetected} Disc detected in drive...");
-            _discDetectedPrinted = true;
-        }
-        else if (line.StartsWith("MSG:1005,"))
-        {
-            var msg = MakeMkvProtocol.ExtractQuoted(line);
-            if (!string.IsNullOrWhiteSpace(msg))
-                _notifier.Muted($"▸ {msg}");
-        }
-        else if (line.StartsWith("MSG:1011,") || line.StartsWith("MSG:3007,"))
-        {
-            var msg = MakeMkvProtocol.ExtractQuoted(line);
-            if (!string.IsNullOrWhiteSpace(msg))
-                _notifier.Muted($"▸ {msg}");
-        }
-        else if (line.StartsWith("MSG:5085,"))
-        {
-            _notifier.Muted("▸ Loaded content hash table");
-        }
-        else if (line.StartsWith("MSG:") && (line.Contains("Scanning") || line.Contains("scanning")) && !_scanningStarted)
-        {
-            _notifier.Info($"{_theme.Emojis.Scan} Scanning disc structure...");
-            _scanningStarted = true;
-        }
-        else if (line.StartsWith("MSG:3307,"))
-        {
-            _titleAddedCount++;
-            var fileMatch = Regex.Match(line, @"""File ([^\s]+)");
-            var titleMatch = Regex.Match(line, @"title #(\d+)");
-            if (fileMatch.Success && titleMatch.Success)
-            {
-                _notifier.Success($"  {_theme.Emojis.Success} Added title #{titleMatch.Groups[1].Value}: {fileMatch.Groups[1].Value}");
-            }
-        }
-        else if (line.StartsWith("MSG:3309,"))
+        switch (prefix)
         {
-            var match = Regex.Match(line, @"""Title ([^\s]+) is equal");
-            if (match.Success)
-            {
-                _notifier.Muted($"  ~ Skipped duplicate: {match.Groups[1].Value}");
-            }
-        }
-        else if (line.StartsWith("MSG:3025,"))
-        {
-            var match = Regex.Match(line, @"""Title #([^\s]+)");
-            if (match.Success)
-            {
-                _notifier.Muted($"  - Skipped short: {match.Groups[1].Value}");
-            }
-        }
-        else if (line.StartsWith("MSG:") && (line.Contains("error") || line.Contains("fail")))
-        {
-            var message = MakeMkvProtocol.ExtractQuoted(line);
-            if (!string.IsNullOrWhiteSpace(message))
-            {
-                _notifier.Error($"{_theme.Emojis.Error} {message}");
-            }
-            else
-            {
-                _notifier.Error($"{_theme.Emojis.Error} {line}");
-            }
-        }
-        else if (line.StartsWith("CINFO:1,"))
-        {
-            var dtype = MakeMkvProtocol.ExtractQuoted(line);
-            if (!string.IsNullOrWhiteSpace(dtype))
-            {
-                _notifier.Accent($"{_theme.Emojis.DiscType} Disc type: {dtype}");
-            }
-        }
-        else if (line.StartsWith("TINFO:"))
-        {
-            var parts = line.Split(new[] { ',' }, 4);
-            if (parts.Length >= 4 && parts[1] == "2")
-            {
-                var tname = MakeMkvProtocol.ExtractQuoted(line);
-                if (!string.IsNullOrWhiteSpace(tname) && _printedTitles.Add(tname!))
+            case "MSG":
+                HandleMessage(line);
+                break;
+            case "DRV":
+                if (!_discDetectedPrinted && line.StartsWith("DRV:0,", StringComparison.Ordinal) && !line.Contains(",256,"))
+                {
+                    _notifier.Success($"{_theme.Emojis.DiscDetected} Disc detected in drive...");
+                    _discDetectedPrinted = true;
+                }
+                break;
+            case "CINFO":
+                if (line.StartsWith("CINFO:1,", StringComparison.Ordinal))
                 {
-                    _notifier.Highlight($"{_theme.Emojis.TitleFound} Title found: {tname}");
+                    var dtype = MakeMkvProtocol.ExtractQuoted(line);
+                    if (!string.IsNullOrWhiteSpace(dtype))
+                    {
+                        _notifier.Accent($"{_theme.Emojis.DiscType} Disc type: {dtype}");
+                    }
                 }
-            }
+                break;
         }
     }
 
-    private void ParseProtocolData(string line)
+    private void HandleMessage(string line)
     {
-        if (line.StartsWith("CINFO:1,"))
-        {
-            _discType = MakeMkvProtocol.ExtractQuoted(line) ?? _discType;
-        }
-        else if (line.StartsWith("CINFO:2,") && string.IsNullOrEmpty(_discName))
+        if (line.Contains("insert disc"))
         {
-            _discName = MakeMkvProtocol.ExtractQuoted(line);
+            _notifier.Warning($"{_theme.Emojis.InsertDisc} Insert a disc into the drive...");
+            return;
         }
-        else if (line.StartsWith("DRV:"))
-        {
-            // ignore
+
+        // Read the message code once instead of testing the line against each known "MSG:<code>," prefix
+        switch (ParseMessageCode(line))
+        {
+            case 1005:
+            case 1011:
+            case 3007:
+                var msg = MakeMkvProtocol.ExtractQuoted(line);
+                if (!string.IsNullOrWhiteSpace(msg))
+                    _notifier.Muted($"▸ {msg}");
+                break;
+            case 5085:
+                _notifier.Muted("▸ Loaded content hash table");
+                break;
+            case 3307:
+                _titleAddedCount++;
+                var fileMatch = AddedFileRegex.Match(line);
+                var titleMatch = AddedTitleNumberRegex.Match(line);
+                if (fileMatch.Success && titleMatch.Success)
+                {
+                    _notifier.Success($"  {_theme.Emojis.Success} Added title #{titleMatch.Groups[1].Value}: {fileMatch.Groups[1].Value}");
+                }
+                break;
+            case 3309:
+                var duplicateMatch = DuplicateTitleRegex.Match(line);
+                if (duplicateMatch.Success)
+                {
+                    _notifier.Muted($"  ~ Skipped duplicate: {duplicateMatch.Groups[1].Value}");
+                }
+                break;
+            case 3025:
+                var shortMatch = ShortTitleRegex.Match(line);
+                if (shortMatch.Success)
+                {
+                    _notifier.Muted($"  - Skipped short: {shortMatch.Groups[1].Value}");
+                }
+                break;
+            default:
+                if (!_scanningStarted && (line.Contains("Scanning") || line.Contains("scanning")))
+                {
+                    _notifier.Info($"{_theme.Emojis.Scan} Scanning disc structure...");
+                    _scanningStarted = true;
+                }
+                else if (line.Contains("error") || line.Contains("fail"))
+                {
+                    var message = MakeMkvProtocol.ExtractQuoted(line);
+                    if (!string.IsNullOrWhiteSpace(message))
+                    {
+                        _notifier.Error($"{_theme.Emojis.Error} {message}");
+                    }
+                    else
+                    {
+                        _notifier.Error($"{_theme.Emojis.Error} {line}");
+                    }
+                }
+                break;
         }
-        else if (line.StartsWith("TINFO:"))
+    }
+
+    // MSG:<code>,<flags>,<count>,"<message>",... - returns -1 when the code is missing or not a number
+    private static int ParseMessageCode(string line)
+    {
+        var payload = line.AsSpan("MSG:".Length);
+        var comma = payload.IndexOf(',');
+        return comma > 0 && int.TryParse(payload[..comma], out var code) ? code : -1;
+    }
+
+    private void ParseProtocolData(ReadOnlySpan<char> prefix, string line)
+    {
+        switch (prefix)
         {
-            ParseTitleInfo(line);
+            case "CINFO":
+                if (line.StartsWith("CINFO:1,", StringComparison.Ordinal))
+                {
+                    _discType = MakeMkvProtocol.ExtractQuoted(line) ?? _discType;
+                }
+                else if (line.StartsWith("CINFO:2,", StringComparison.Ordinal) && string.IsNullOrEmpty(_discName))
+                {
+                    _discName = MakeMkvProtocol.ExtractQuoted(line);
+                }
+                break;
+            case "TINFO":
+                ParseTitleInfo(line);
+                break;
         }
     }
 
     private void ParseTitleInfo(string line)
     {
-        var match = Regex.Match(line, @"TINFO:(\d+),(\d+),");
+        var match = TitleInfoRegex.Match(line);
         if (!match.Success) return;
 
-        var id = int.Parse(match.Groups[1].Value);
-        var fieldId = int.Parse(match.Groups[2].Value);
-
-        if (!_titles.Exists(t => t.Id == id))
-            _titles.Add(new TitleInfo { Id = id });
+        var id = int.Parse(match.Groups["id"].ValueSpan);
+        var fieldId = int.Parse(match.Groups["field"].ValueSpan);
+        // Most TINFO fields are ignored, so the value is only turned into a string for the title name
+        var value = match.Groups["value"];
 
-        var title = _titles.Find(x => x.Id == id)!;
+        if (!_titlesById.TryGetValue(id, out var title))
+        {
+            title = new TitleInfo { Id = id };
+            _titlesById[id] = title;
+            _titles.Add(title);
+        }
 
         switch (fieldId)
         {
             case 2: // Title name
-                var name = MakeMkvProtocol.ExtractQuoted(line);
-                if (!string.IsNullOrWhiteSpace(name))
+                if (value.Success && !value.ValueSpan.IsWhiteSpace())
                 {
-                    title.Name = name;
+                    title.Name = value.Value;
                     if (_discName == null)
-                        _discName = name;
+                        _discName = title.Name;
+                    // Announced from the same match, so a TINFO line is only parsed once
+                    if (_printedTitles.Add(title.Name))
+                        _notifier.Highlight($"{_theme.Emojis.TitleFound} Title found: {title.Name}");
                 }
                 break;
             case 9: // Duration (HH:MM:SS format)
-                var durStr = MakeMkvProtocol.ExtractQuoted(line);
-                title.DurationSeconds = ParseDurationToSeconds(durStr);
+                title.DurationSeconds = value.Success ? ParseDurationToSeconds(value.ValueSpan) : 0;
                 break;
             case 11: // Size in bytes
-                var sizeStr = MakeMkvProtocol.ExtractQuoted(line);
-                if (long.TryParse(sizeStr, out var bytes))
+                if (value.Success && long.TryParse(value.ValueSpan, out var bytes))
                     title.ReportedSizeBytes = bytes;
                 break;
         }
     }
 
-    private static int ParseDurationToSeconds(string? s)
+    private static int ParseDurationToSeconds(ReadOnlySpan<char> span)
     {
-        if (string.IsNullOrEmpty(s)) return 0;
-        var parts = s.Split(':');
-        if (parts.Length == 3 && int.TryParse(parts[0], out var h) && int.TryParse(parts[1], out var m) && int.TryParse(parts[2], out var sec))
+        // Split into ranges over the original string rather than allocating an array of substrings
+        Span<Range> parts = stackalloc Range[4];
+        if (span.Split(parts, ':') == 3 && int.TryParse(span[parts[0]], out var h) && int.TryParse(span[parts[1]], out var m) && int.TryParse(span[parts[2]], out var sec))
             return h * 3600 + m * 60 + sec;
         return 0;
     }
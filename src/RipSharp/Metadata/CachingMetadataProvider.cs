@@ -0,0 +1,42 @@
+namespace BugZapperLabs.RipSharp.Metadata;
+
+/// <summary>
+/// Wraps a provider so that successful lookups are answered from <see cref="MetadataCache"/> on later runs.
+/// Misses are not cached, so a title that was not found is retried next time.
+/// Movie results rarely change and are kept for a week; TV results are refreshed daily as new seasons appear.
+/// An expired entry is still returned when the refresh comes back empty, so an unreachable provider does not lose a known title.
+/// </summary>
+public class CachingMetadataProvider : IMetadataProvider
+{
+    internal static readonly TimeSpan MovieMaxAge = TimeSpan.FromDays(7);
+    internal static readonly TimeSpan TvMaxAge = TimeSpan.FromDays(1);
+
+    private readonly IMetadataProvider _inner;
+    private readonly MetadataCache _cache;
+
+    public CachingMetadataProvider(IMetadataProvider inner, MetadataCache cache)
+    {
+        _inner = inner;
+        _cache = cache;
+    }
+
+    public string Name => _inner.Name;
+
+    public async Task<ContentMetadata?> LookupAsync(string title, bool isTv, int? year)
+    {
+        var key = BuildKey(title, isTv, year);
+        var hasCached = _cache.TryGet(key, out var cached, out var age);
+        if (hasCached && age < (isTv ? TvMaxAge : MovieMaxAge))
+            return cached;
+
+        var result = await _inner.LookupAsync(title, isTv, year);
+        if (result == null)
+            return cached;
+
+        _cache.Set(key, result);
+        return result;
+    }
+
+    private string BuildKey(string title, bool isTv, int? year) =>
+        $"{Name}|{(isTv ? "tv" : "movie")}|{year?.ToString() ?? ""}|{title.Trim().ToLowerInvariant()}";
+}
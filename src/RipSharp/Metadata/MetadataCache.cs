@@ -0,0 +1,100 @@
+using System.Text.Json;
+
+namespace BugZapperLabs.RipSharp.Metadata;
+
+/// <summary>
+/// Small JSON file of successful metadata lookups, so ripping the same disc again skips the online round-trips.
+/// Each entry records when it was fetched, so callers can decide how old an entry may be before it is looked up again.
+/// The cache is best-effort: an unreadable or unwritable file just means every lookup goes online.
+/// </summary>
+public class MetadataCache
+{
+    internal const string FileName = "metadata-cache.json";
+
+    private readonly string _path;
+    private readonly object _lock = new();
+    private Dictionary<string, Entry>? _entries;
+
+    public MetadataCache(string path)
+    {
+        _path = path;
+    }
+
+    public bool TryGet(string key, out ContentMetadata? metadata, out TimeSpan age)
+    {
+        lock (_lock)
+        {
+            if (Load().TryGetValue(key, out var entry))
+            {
+                metadata = entry.Metadata;
+                age = DateTime.UtcNow - entry.FetchedUtc;
+                return true;
+            }
+
+            metadata = null;
+            age = TimeSpan.MaxValue;
+            return false;
+        }
+    }
+
+    public void Set(string key, ContentMetadata metadata)
+    {
+        lock (_lock)
+        {
+            var entries = Load();
+            entries[key] = new Entry(metadata, DateTime.UtcNow);
+
+            try
+            {
+                var directory = Path.GetDirectoryName(_path);
+                if (!string.IsNullOrEmpty(directory))
+                    Directory.CreateDirectory(directory);
+
+                // Write beside the real file and swap it in, so a crash never leaves half a cache behind
+                var tempPath = _path + ".tmp";
+                File.WriteAllText(tempPath, JsonSerializer.Serialize(entries));
+                File.Move(tempPath, _path, overwrite: true);
+            }
+            catch (Exception ex) when (ex is IOException or UnauthorizedAccessException) { }
+        }
+    }
+
+    internal static string? GetDefaultPath()
+    {
+        string? baseDirectory;
+        if (OperatingSystem.IsLinux())
+        {
+            var xdgCacheHome = Environment.GetEnvironmentVariable("XDG_CACHE_HOME");
+            var home = Environment.GetFolderPath(Environment.SpecialFolder.UserProfile);
+            baseDirectory = !string.IsNullOrWhiteSpace(xdgCacheHome) ? xdgCacheHome
+                : !string.IsNullOrWhiteSpace(home) ? Path.Combine(home, ".cache")
+                : null;
+        }
+        else
+        {
+            baseDirectory = Environment.GetFolderPath(Environment.SpecialFolder.LocalApplicationData);
+        }
+
+        return string.IsNullOrWhiteSpace(baseDirectory)
+            ? null
+            : Path.Combine(baseDirectory, ConfigFileLocator.AppName, FileName);
+    }
+
+    private Dictionary<string, Entry> Load()
+    {
+        if (_entries != null) return _entries;
+
+        try
+        {
+            if (File.Exists(_path))
+            {
+                _entries = JsonSerializer.Deserialize<Dictionary<string, Entry>>(File.ReadAllText(_path));
+            }
+        }
+        catch (Exception ex) when (ex is IOException or UnauthorizedAccessException or JsonException) { }
+
+        return _entries ??= new Dictionary<string, Entry>();
+    }
+
+    internal sealed record Entry(ContentMetadata Metadata, DateTime FetchedUtc);
+}
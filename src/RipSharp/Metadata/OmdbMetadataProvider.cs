@@ -22,8 +22,8 @@ public class OmdbMetadataProvider : IMetadataProvider
         try
         {
             var url = $"https://www.omdbapi.com/?apikey={_apiKey}&type={(isTv ? "series" : "movie")}&t={Uri.EscapeDataString(title)}" + (year.HasValue ? $"&y={year.Value}" : "");
-            var json = await _http.GetStringAsync(url);
-            var doc = JsonDocument.Parse(json);
+            await using var stream = await _http.GetStreamAsync(url);
+            using var doc = await JsonDocument.ParseAsync(stream);
             if (doc.RootElement.TryGetProperty("Response", out var resp) && resp.GetString() == "True")
             {
                 var result = new ContentMetadata
@@ -35,7 +35,8 @@ public class OmdbMetadataProvider : IMetadataProvider
                 return result;
             }
         }
-        catch { }
+        // Network failures, timeouts and unexpected response shapes all mean "no match"
+        catch (Exception ex) when (ex is HttpRequestException or TaskCanceledException or JsonException or InvalidOperationException or IOException) { }
         return null;
     }
 }
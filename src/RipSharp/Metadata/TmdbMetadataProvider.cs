@@ -23,15 +23,16 @@ public class TmdbMetadataProvider : IMetadataProvider
         {
             return await (isTv ? LookupTvAsync(title, year) : LookupMovieAsync(title, year));
         }
-        catch { }
+        // Network failures, timeouts and unexpected response shapes all mean "no match"
+        catch (Exception ex) when (ex is HttpRequestException or TaskCanceledException or JsonException or InvalidOperationException or FormatException or IOException) { }
         return null;
     }
 
     private async Task<ContentMetadata?> LookupTvAsync(string title, int? year)
     {
         var url = $"https://api.themoviedb.org/3/search/tv?api_key={_apiKey}&query={Uri.EscapeDataString(title)}" + (year.HasValue ? $"&first_air_date_year={year.Value}" : "");
-        var json = await _http.GetStringAsync(url);
-        var doc = JsonDocument.Parse(json);
+        await using var stream = await _http.GetStreamAsync(url);
+        using var doc = await JsonDocument.ParseAsync(stream);
         var results = doc.RootElement.TryGetProperty("results", out var r) ? r : default;
         if (results.ValueKind == JsonValueKind.Array && results.GetArrayLength() > 0)
         {
@@ -47,8 +48,8 @@ public class TmdbMetadataProvider : IMetadataProvider
     private async Task<ContentMetadata?> LookupMovieAsync(string title, int? year)
     {
         var url = $"https://api.themoviedb.org/3/search/movie?api_key={_apiKey}&query={Uri.EscapeDataString(title)}" + (year.HasValue ? $"&year={year.Value}" : "");
-        var json = await _http.GetStringAsync(url);
-        var doc = JsonDocument.Parse(json);
+        await using var stream = await _http.GetStreamAsync(url);
+        using var doc = await JsonDocument.ParseAsync(stream);
         var results = doc.RootElement.TryGetProperty("results", out var r) ? r : default;
         if (results.ValueKind == JsonValueKind.Array && results.GetArrayLength() > 0)
         {
@@ -15,9 +15,11 @@ public class TvdbMetadataProvider : IMetadataProvider, ITvEpisodeTitleProvider
     private readonly string _apiKey;
     private readonly IConsoleWriter _notifier;
 
-    private string? _token;
+    // Episode lookups run concurrently; callers share one login and one search per series instead of each starting their own
+    private readonly object _tokenLock = new();
+    private Task<string?>? _tokenRequest;
     private DateTime _tokenExpiryUtc = DateTime.MinValue;
-    private readonly ConcurrentDictionary<string, (int? seriesId, string? seriesName, int? year)> _seriesCache = new();
+    private readonly ConcurrentDictionary<string, Lazy<Task<(int? seriesId, string? seriesName, int? year)>>> _seriesSearches = new();
 
     public string Name => "TVDB";
 
@@ -48,11 +50,7 @@ public class TvdbMetadataProvider : IMetadataProvider, ITvEpisodeTitleProvider
 
     public async Task<string?> GetEpisodeTitleAsync(string seriesTitle, int season, int episode, int? year)
     {
-        var cacheKey = BuildCacheKey(seriesTitle, year);
-        var series = _seriesCache.ContainsKey(cacheKey)
-            ? _seriesCache[cacheKey]
-            : await SearchSeriesAsync(seriesTitle, year);
-
+        var series = await SearchSeriesAsync(seriesTitle, year);
         if (series.seriesId == null)
             return null;
 
@@ -61,12 +59,26 @@ public class TvdbMetadataProvider : IMetadataProvider, ITvEpisodeTitleProvider
 
     private string BuildCacheKey(string title, int? year) => $"{title.Trim().ToLowerInvariant()}|{year?.ToString() ?? ""}";
 
+    // The outcome is kept whether or not the series was found, so a miss is not searched again for every episode
     private async Task<(int? seriesId, string? seriesName, int? year)> SearchSeriesAsync(string title, int? year)
     {
         var cacheKey = BuildCacheKey(title, year);
-        if (_seriesCache.TryGetValue(cacheKey, out var cached))
-            return cached;
+        var search = _seriesSearches.GetOrAdd(cacheKey,
+            _ => new Lazy<Task<(int? seriesId, string? seriesName, int? year)>>(() => SearchSeriesUncachedAsync(title, year)));
+        try
+        {
+            return await search.Value;
+        }
+        catch
+        {
+            // A failed request is not an answer; let the next caller try again
+            _seriesSearches.TryRemove(new KeyValuePair<string, Lazy<Task<(int? seriesId, string? seriesName, int? year)>>>(cacheKey, search));
+            throw;
+        }
+    }
 
+    private async Task<(int? seriesId, string? seriesName, int? year)> SearchSeriesUncachedAsync(string title, int? year)
+    {
         var token = await GetTokenAsync();
         if (token == null)
             return (null, null, null);
@@ -77,12 +89,12 @@ public class TvdbMetadataProvider : IMetadataProvider, ITvEpisodeTitleProvider
         using var request = new HttpRequestMessage(HttpMethod.Get, url);
         request.Headers.Authorization = new AuthenticationHeaderValue("Bearer", token);
 
-        var response = await _http.SendAsync(request);
+        using var response = await _http.SendAsync(request);
         if (!response.IsSuccessStatusCode)
             return (null, null, null);
 
-        var json = await response.Content.ReadAsStringAsync();
-        using var doc = JsonDocument.Parse(json);
+        await using var stream = await response.Content.ReadAsStreamAsync();
+        using var doc = await JsonDocument.ParseAsync(stream);
         if (!doc.RootElement.TryGetProperty("data", out var data) || data.ValueKind != JsonValueKind.Array || data.GetArrayLength() == 0)
             return (null, null, null);
 
@@ -94,10 +106,7 @@ public class TvdbMetadataProvider : IMetadataProvider, ITvEpisodeTitleProvider
         if (first.TryGetProperty("first_air_time", out var fa) && fa.GetString() is string faStr && faStr.Length >= 4 && int.TryParse(faStr.Substring(0, 4), out var fy))
             foundYear = fy;
 
-        var result = (id, name, foundYear);
-        if (id != null)
-            _seriesCache[cacheKey] = result;
-        return result;
+        return (id, name, foundYear);
     }
 
     private static bool TryGetInt32Flexible(JsonElement element, out int value)
@@ -122,12 +131,12 @@ public class TvdbMetadataProvider : IMetadataProvider, ITvEpisodeTitleProvider
         using var request = new HttpRequestMessage(HttpMethod.Get, url);
         request.Headers.Authorization = new AuthenticationHeaderValue("Bearer", token);
 
-        var response = await _http.SendAsync(request);
+        using var response = await _http.SendAsync(request);
         if (!response.IsSuccessStatusCode)
             return null;
 
-        var json = await response.Content.ReadAsStringAsync();
-        using var doc = JsonDocument.Parse(json);
+        await using var stream = await response.Content.ReadAsStreamAsync();
+        using var doc = await JsonDocument.ParseAsync(stream);
         if (!doc.RootElement.TryGetProperty("data", out var data))
             return null;
 
@@ -148,26 +157,36 @@ public class TvdbMetadataProvider : IMetadataProvider, ITvEpisodeTitleProvider
         return null;
     }
 
-    private async Task<string?> GetTokenAsync()
+    private Task<string?> GetTokenAsync()
     {
-        if (!string.IsNullOrWhiteSpace(_token) && DateTime.UtcNow < _tokenExpiryUtc)
-            return _token;
+        lock (_tokenLock)
+        {
+            // Reuse a login that is in flight or still valid; start a new one only after a failure or expiry
+            if (_tokenRequest == null || (_tokenRequest.IsCompleted && !HasValidToken(_tokenRequest)))
+                _tokenRequest = LoginAsync();
+            return _tokenRequest;
+        }
+    }
+
+    private bool HasValidToken(Task<string?> tokenRequest) =>
+        tokenRequest.IsCompletedSuccessfully && tokenRequest.Result != null && DateTime.UtcNow < _tokenExpiryUtc;
 
+    private async Task<string?> LoginAsync()
+    {
         var payload = JsonSerializer.Serialize(new { apikey = _apiKey });
         using var content = new StringContent(payload, Encoding.UTF8, "application/json");
-        var response = await _http.PostAsync("https://api4.thetvdb.com/v4/login", content);
+        using var response = await _http.PostAsync("https://api4.thetvdb.com/v4/login", content);
         if (!response.IsSuccessStatusCode)
             return null;
 
-        var json = await response.Content.ReadAsStringAsync();
-        using var doc = JsonDocument.Parse(json);
+        await using var stream = await response.Content.ReadAsStreamAsync();
+        using var doc = await JsonDocument.ParseAsync(stream);
         if (!doc.RootElement.TryGetProperty("data", out var data))
             return null;
         if (data.TryGetProperty("token", out var tokenEl) && tokenEl.GetString() is string token)
         {
-            _token = token;
             _tokenExpiryUtc = DateTime.UtcNow.AddMinutes(55); // TVDB tokens typically last 1 hour
-            return _token;
+            return token;
         }
 
         return null;
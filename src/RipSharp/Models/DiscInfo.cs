@@ -6,6 +6,33 @@ public class DiscInfo
     public string DiscType { get; set; } = string.Empty; // dvd|bd|uhd
     public List<TitleInfo> Titles { get; set; } = new();
 
+    private Dictionary<int, TitleInfo>? _titlesById;
+    private List<TitleInfo>? _indexedTitles;
+    private int _indexedCount;
+
+    /// <summary>
+    /// Titles keyed by id (first entry wins on duplicates). Built on first use and rebuilt only when
+    /// <see cref="Titles"/> is replaced or changes size.
+    /// </summary>
+    public IReadOnlyDictionary<int, TitleInfo> TitlesById
+    {
+        get
+        {
+            if (_titlesById == null || !ReferenceEquals(_indexedTitles, Titles) || _indexedCount != Titles.Count)
+            {
+                var titlesById = new Dictionary<int, TitleInfo>(Titles.Count);
+                foreach (var title in Titles)
+                {
+                    titlesById.TryAdd(title.Id, title);
+                }
+                _titlesById = titlesById;
+                _indexedTitles = Titles;
+                _indexedCount = Titles.Count;
+            }
+            return _titlesById;
+        }
+    }
+
     /// <summary>
     /// Auto-detected content type: true for TV series, false for movie, null if detection uncertain.
     /// </summary>
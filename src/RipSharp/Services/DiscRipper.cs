@@ -7,7 +7,8 @@ public record RipJob(
     int TitleId,
     int Index,
     string RippedFilePath,
-    TitleInfo TitleInfo);
+    TitleInfo TitleInfo,
+    Task<MediaFileAnalysis?> Analysis);
 
 public record EncodeResult(
     int TitleId,
@@ -18,6 +19,8 @@ public record EncodeResult(
 public class DiscRipper : IDiscRipper
 {
     private const int RipProgressScale = 100;
+    // Episode titles come from a rate-limited third-party API; keep only a few requests in flight
+    private const int EpisodeTitleLookupConcurrency = 4;
     private readonly IDiscScanner _scanner;
     private readonly IEncoderService _encoder;
     private readonly IMetadataService _metadata;
@@ -86,25 +89,31 @@ public class DiscRipper : IDiscRipper
         }
 
         _notifier.Success($"Processing complete. Output files: {finalFiles.Count}");
-        foreach (var f in finalFiles) _notifier.Plain(f);
+        // One console write for the whole list rather than one per file
+        if (finalFiles.Count > 0) _notifier.Plain(string.Join(Environment.NewLine, finalFiles));
         return finalFiles;
     }
 
     private async Task<List<string>> ProcessDiscSequentialAsync(DiscInfo discInfo, List<int> titleIds, ContentMetadata metadata, RipOptions options, CancellationToken cancellationToken)
     {
-        var rippedFilesMap = await RipTitlesAsync(discInfo, titleIds, options);
-        return await EncodeAndRenameAsync(discInfo, titleIds, rippedFilesMap, metadata, options);
+        var rippedFilesMap = await RipTitlesAsync(discInfo, titleIds, options, cancellationToken);
+        return await EncodeAndRenameAsync(discInfo, titleIds, rippedFilesMap, metadata, options, cancellationToken);
     }
 
     private async Task<List<TitlePlan>> BuildTitlePlansAsync(DiscInfo discInfo, List<int> titleIds, ContentMetadata metadata, RipOptions options)
     {
         var plans = new List<TitlePlan>(titleIds.Count);
         var safeSeriesTitle = FileNaming.SanitizeFileName(metadata.Title);
+        var titlesById = discInfo.TitlesById;
+        // Fetch episode titles early so we can display/name immediately
+        var episodeTitles = options.Tv
+            ? await FetchEpisodeTitlesAsync(metadata, options, titleIds.Count)
+            : null;
 
         for (var idx = 0; idx < titleIds.Count; idx++)
         {
             var titleId = titleIds[idx];
-            var titleInfo = discInfo.Titles.FirstOrDefault(t => t.Id == titleId);
+            var titleInfo = titlesById.GetValueOrDefault(titleId);
             var titleName = titleInfo?.Name;
 
             int? episodeNum = null;
@@ -117,8 +126,7 @@ public class DiscRipper : IDiscRipper
             if (options.Tv)
             {
                 episodeNum = (options.EpisodeStart - 1) + idx + 1;
-                // Fetch episode title early so we can display/name immediately
-                episodeTitle = await _episodeTitles.GetEpisodeTitleAsync(metadata.Title, options.Season, episodeNum.Value, metadata.Year);
+                episodeTitle = episodeTitles![idx];
 
                 var safeEpisodeTitle = string.IsNullOrWhiteSpace(episodeTitle) ? "" : $" - {FileNaming.SanitizeFileName(episodeTitle)}";
                 finalFileName = $"{safeSeriesTitle} - S{options.Season:00}E{episodeNum:00}{safeEpisodeTitle}.mkv";
@@ -168,8 +176,8 @@ public class DiscRipper : IDiscRipper
 
                 // Start both ripping and encoding tasks in parallel
                 var ripTask = Task.Run(() => RipProducerAsync(ripChannel, discInfo, titleIds, titlePlans, options, ripProgress, overallTracker, cts.Token));
-                var encodeTask = Task.Run(() => EncodeConsumerAsync(ripChannel, resultChannel, titlePlans, metadata, options, encodeProgress, overallTracker, cts.Token));
-                var collectTask = CollectResultsAsync(resultChannel, titleIds.Count, cts.Token);
+                var encodeTask = RunEncodeConsumersAsync(ripChannel, resultChannel, titlePlans, metadata, options, encodeProgress, overallTracker, cts.Token);
+                var collectTask = CollectResultsAsync(resultChannel, titleIds, cts.Token);
 
                 // Wait for both to complete
                 await Task.WhenAll(ripTask, encodeTask);
@@ -194,6 +202,19 @@ public class DiscRipper : IDiscRipper
         }
     }
 
+    private async Task<string?[]> FetchEpisodeTitlesAsync(ContentMetadata metadata, RipOptions options, int count)
+    {
+        var titles = new string?[count];
+        if (count == 0) return titles;
+
+        var parallelOptions = new ParallelOptions { MaxDegreeOfParallelism = EpisodeTitleLookupConcurrency };
+        await Parallel.ForEachAsync(Enumerable.Range(0, count), parallelOptions, async (i, _) =>
+        {
+            titles[i] = await _episodeTitles.GetEpisodeTitleAsync(metadata.Title, options.Season, options.EpisodeStart + i, metadata.Year);
+        });
+        return titles;
+    }
+
     private static void PrepareDirectories(RipOptions options)
     {
         Directory.CreateDirectory(options.Output);
@@ -254,119 +275,171 @@ public class DiscRipper : IDiscRipper
         return titleIds;
     }
 
-    private async Task<Dictionary<int, string>> RipTitlesAsync(DiscInfo discInfo, List<int> titleIds, RipOptions options)
+    private async Task<Dictionary<int, string>> RipTitlesAsync(DiscInfo discInfo, List<int> titleIds, RipOptions options, CancellationToken cancellationToken)
     {
         var rippedFilesMap = new Dictionary<int, string>();
         var totalTitles = titleIds.Count;
-        var preExistingRips = new Queue<string>(Directory.EnumerateFiles(options.Temp!, "*.mkv").OrderBy(File.GetCreationTime));
-        for (int idx = 0; idx < titleIds.Count; idx++)
+        var titlesById = discInfo.TitlesById;
+        var preExistingRips = new Queue<string>(EnumerateMkvsOldestFirst(options.Temp!));
+        var knownMkvs = new HashSet<string>(preExistingRips);
+
+        // One live display for the whole disc; each title resets the shared task instead of starting a new session
+        await _progressDisplay.ExecuteAsync(async ctx =>
         {
-            var titleId = titleIds[idx];
-            var titleInfo = discInfo.Titles.FirstOrDefault(t => t.Id == titleId);
-            var titleName = titleInfo?.Name;
+            var task = ctx.AddTask($"[{_theme.Colors.Success}]Ripping[/]", RipProgressScale);
 
-            if (preExistingRips.Count > 0)
+            for (int idx = 0; idx < titleIds.Count; idx++)
             {
-                var reused = preExistingRips.Dequeue();
-                _notifier.Muted($"Using existing ripped file for title {idx + 1} of {totalTitles} (Title ID: {titleId}) -> {Path.GetFileName(reused)}");
-                rippedFilesMap[titleId] = reused;
-                continue;
-            }
+                // Stop before starting another makemkvcon once the user has asked to quit
+                cancellationToken.ThrowIfCancellationRequested();
 
-            _notifier.Info($"Ripping title {idx + 1} of {totalTitles} (Title ID: {titleId}){(string.IsNullOrWhiteSpace(titleName) ? "" : $" - {titleName}")} [{DurationFormatter.Format(titleInfo?.DurationSeconds ?? 0)}]");
-            var existingFiles = new HashSet<string>(Directory.EnumerateFiles(options.Temp!, "*.mkv"));
-            var progressLogPath = Path.Combine(options.Temp!, $"progress_title_{titleId:D2}.log");
-            if (File.Exists(progressLogPath)) File.Delete(progressLogPath);
+                var titleId = titleIds[idx];
+                var titleInfo = titlesById.GetValueOrDefault(titleId);
+                var titleName = titleInfo?.Name;
+
+                if (preExistingRips.Count > 0)
+                {
+                    var reused = preExistingRips.Dequeue();
+                    task.AddMessage($"Using existing ripped file for title {idx + 1} of {totalTitles} (Title ID: {titleId}) -> {Path.GetFileName(reused)}");
+                    rippedFilesMap[titleId] = reused;
+                    continue;
+                }
+
+                task.Value = 0;
+                task.Description = $"[{_theme.Colors.Success}]Title {idx + 1} ({idx + 1}/{totalTitles})[/]";
+                task.AddMessage($"Ripping title {idx + 1} of {totalTitles} (Title ID: {titleId}){(string.IsNullOrWhiteSpace(titleName) ? "" : $" - {titleName}")} [{DurationFormatter.Format(titleInfo?.DurationSeconds ?? 0)}]");
+                var progressLogPath = Path.Combine(options.Temp!, $"progress_title_{titleId:D2}.log");
+                File.Delete(progressLogPath);
 
-            await _progressDisplay.ExecuteAsync(async ctx =>
-            {
                 var expectedBytes = titleInfo?.ReportedSizeBytes ?? 0;
-                var maxValue = expectedBytes > 0 ? expectedBytes : 100;
-                var task = ctx.AddTask($"[{_theme.Colors.Success}]Title {idx + 1} ({idx + 1}/{totalTitles})[/]", maxValue);
-                bool ripDone = false;
+                var rawLogPath = Path.Combine(options.Temp!, $"makemkv_title_{titleId:D2}.log");
+                using var handler = new MakeMkvOutputHandler(expectedBytes, idx, totalTitles, task,
+                    options.Debug ? progressLogPath : null, rawLogPath, _notifier, _theme);
+                using var ripFinished = new CancellationTokenSource();
 
                 var pollTask = Task.Run(async () =>
                 {
                     double lastSizeLocal = 0;
                     string? currentMkv = null;
-                    while (!ripDone)
+                    while (!ripFinished.IsCancellationRequested)
                     {
                         try
                         {
-                            // Identify the mkv file being written for this title: the first new mkv not in existingFiles
-                            if (currentMkv == null)
+                            var fraction = handler.LastProgressFraction;
+                            if (expectedBytes > 0)
                             {
-                                currentMkv = Directory
-                                    .EnumerateFiles(options.Temp!, "*.mkv")
-                                    .FirstOrDefault(f => !existingFiles.Contains(f));
-                            }
-
-                            if (currentMkv != null && expectedBytes > 0)
-                            {
-                                var size = new FileInfo(currentMkv).Length;
-                                lastSizeLocal = Math.Max(lastSizeLocal, size);
-                                task.Value = (long)Math.Min(expectedBytes, lastSizeLocal);
+                                // Identify the mkv file being written for this title once, then only stat it
+                                currentMkv ??= FindRippedMkv(options.Temp!, titleId, knownMkvs);
+                                if (currentMkv != null)
+                                {
+                                    var size = new FileInfo(currentMkv).Length;
+                                    lastSizeLocal = Math.Max(lastSizeLocal, size);
+                                    fraction = Math.Max(fraction, Math.Min(1.0, lastSizeLocal / expectedBytes));
+                                }
                             }
+                            task.Value = (long)Math.Round(fraction * RipProgressScale);
                         }
-                        catch { }
-                        await Task.Delay(1000);
+                        catch (Exception ex) when (ex is IOException or UnauthorizedAccessException) { }
+                        await WaitForNextPollAsync(TimeSpan.FromSeconds(1), ripFinished.Token);
                     }
                 });
 
-                var rawLogPath = Path.Combine(options.Temp!, $"makemkv_title_{titleId:D2}.log");
-                var handler = new MakeMkvOutputHandler(expectedBytes, idx, totalTitles, task, progressLogPath, rawLogPath, _notifier, _theme);
                 var exit = await _makeMkv.RipTitleAsync(options.Disc, titleId, options.Temp!,
                     onOutput: handler.HandleLine,
                     onError: errLine =>
                     {
-                        if (!(errLine.StartsWith("PRGV:") || errLine.StartsWith("PRGC:")))
+                        if (!MakeMkvProtocol.IsProgressLine(errLine))
                         {
                             _notifier.Error(errLine);
                         }
                         handler.HandleLine(errLine);
-                    });
-                ripDone = true;
+                    },
+                    ct: cancellationToken);
+                ripFinished.Cancel();
                 try { await pollTask; } catch { }
 
                 if (exit != 0)
                 {
                     task.Description = $"[{_theme.Colors.Error}]Failed: Title {titleId}[/]";
-                    task.StopTask();
                     _notifier.Error($"Failed to rip title {titleId}");
-                    return;
                 }
-                if (handler.LastBytesProcessed < maxValue)
+                else
                 {
-                    task.Value = maxValue;
+                    task.Value = RipProgressScale;
                 }
-                task.StopTask();
-            });
 
-            var newFiles = Directory.EnumerateFiles(options.Temp!, "*.mkv").Where(f => !existingFiles.Contains(f)).ToList();
-            if (newFiles.Count > 0)
-            {
-                var ripped = newFiles.OrderByDescending(File.GetCreationTime).First();
-                rippedFilesMap[titleId] = ripped;
+                var ripped = FindRippedMkv(options.Temp!, titleId, knownMkvs);
+                if (ripped != null)
+                {
+                    rippedFilesMap[titleId] = ripped;
+                }
+                RememberRipOutput(options.Temp!, knownMkvs, ripped);
             }
-        }
+
+            task.StopTask();
+        });
+
         return rippedFilesMap;
     }
 
+    // FileInfo instances from a directory enumeration carry their attributes, so ordering by
+    // creation time does not need a separate stat call per file.
+    private static IEnumerable<string> EnumerateMkvsOldestFirst(string directory)
+    {
+        return new DirectoryInfo(directory)
+            .EnumerateFiles("*.mkv")
+            .OrderBy(f => f.CreationTime)
+            .Select(f => Path.Combine(directory, f.Name));
+    }
+
+    // The known set is built from one enumeration up front and then grown as each rip finishes, so
+    // titles after the first do not rescan the temp directory. Only a rip that produced no usable
+    // file (which may have left a partial one behind) falls back to a fresh listing.
+    private static void RememberRipOutput(string directory, HashSet<string> knownMkvs, string? rippedPath)
+    {
+        if (rippedPath != null)
+        {
+            knownMkvs.Add(rippedPath);
+        }
+        else if (Directory.Exists(directory))
+        {
+            knownMkvs.UnionWith(Directory.EnumerateFiles(directory, "*.mkv"));
+        }
+    }
+
+    // One pass over the temp directory: a new file named for the title (MakeMKV writes "<name>_tNN.mkv")
+    // wins outright, otherwise the newest new mkv is taken.
+    private static string? FindRippedMkv(string directory, int titleId, HashSet<string> excludedPaths)
+    {
+        var titleSuffix = $"_t{titleId:D2}.mkv";
+        FileInfo? newest = null;
+        foreach (var file in new DirectoryInfo(directory).EnumerateFiles("*.mkv"))
+        {
+            var path = Path.Combine(directory, file.Name);
+            if (excludedPaths.Contains(path)) continue;
+            if (file.Name.EndsWith(titleSuffix, StringComparison.OrdinalIgnoreCase)) return path;
+            if (newest == null || file.CreationTime > newest.CreationTime) newest = file;
+        }
+        return newest == null ? null : Path.Combine(directory, newest.Name);
+    }
+
     private async Task RipProducerAsync(Channel<RipJob> ripChannel, DiscInfo discInfo, List<int> titleIds, IReadOnlyList<TitlePlan> plans, RipOptions options, IProgressTask ripProgress, OverallProgressTracker overallTracker, CancellationToken cancellationToken)
     {
         try
         {
             var totalTitles = titleIds.Count;
+            var titlesById = discInfo.TitlesById;
             var ripStartTime = DateTime.UtcNow;
             var rippedCount = 0;
-            var preExistingRips = new Queue<string>(Directory.Exists(options.Temp!) ? Directory.EnumerateFiles(options.Temp!, "*.mkv").OrderBy(File.GetCreationTime) : Enumerable.Empty<string>());
+            var preExistingRips = new Queue<string>(Directory.Exists(options.Temp!) ? EnumerateMkvsOldestFirst(options.Temp!) : Enumerable.Empty<string>());
+            var knownMkvs = new HashSet<string>(preExistingRips);
 
             for (int idx = 0; idx < titleIds.Count; idx++)
             {
                 if (cancellationToken.IsCancellationRequested) break;
 
                 var titleId = titleIds[idx];
-                var titleInfo = discInfo.Titles.FirstOrDefault(t => t.Id == titleId);
+                var titleInfo = titlesById.GetValueOrDefault(titleId);
 
                 if (titleInfo == null)
                 {
@@ -386,7 +459,7 @@ public class DiscRipper : IDiscRipper
                     var msg = $"Using existing ripped file for title {idx + 1} of {totalTitles}: {plan.DisplayName} (Title ID: {titleId}) -> {Path.GetFileName(reused)}";
                     ripProgress.AddMessage(msg);
 
-                    await ripChannel.Writer.WriteAsync(new RipJob(titleId, idx, reused, titleInfo), cancellationToken);
+                    await ripChannel.Writer.WriteAsync(new RipJob(titleId, idx, reused, titleInfo, _encoder.AnalyzeAsync(reused)), cancellationToken);
                     ripProgress.Description = $"{plan.DisplayName} [100%]";
                     ripProgress.Value += RipProgressScale;
                     rippedCount++;
@@ -395,11 +468,11 @@ public class DiscRipper : IDiscRipper
                 }
 
                 // Perform actual rip with live progress contribution
-                var rippedPath = await PerformSingleRipAsync(titleId, idx, titleInfo, plan, totalTitles, options, ripProgress);
+                var rippedPath = await PerformSingleRipAsync(titleId, idx, titleInfo, plan, totalTitles, options, ripProgress, knownMkvs, cancellationToken);
 
                 if (!string.IsNullOrEmpty(rippedPath))
                 {
-                    await ripChannel.Writer.WriteAsync(new RipJob(titleId, idx, rippedPath, titleInfo), cancellationToken);
+                    await ripChannel.Writer.WriteAsync(new RipJob(titleId, idx, rippedPath, titleInfo, _encoder.AnalyzeAsync(rippedPath)), cancellationToken);
                     rippedCount++;
                     overallTracker.MarkRipComplete();
                 }
@@ -427,7 +500,7 @@ public class DiscRipper : IDiscRipper
         }
     }
 
-    private async Task<string?> PerformSingleRipAsync(int titleId, int idx, TitleInfo? titleInfo, TitlePlan plan, int totalTitles, RipOptions options, IProgressTask ripProgress)
+    private async Task<string?> PerformSingleRipAsync(int titleId, int idx, TitleInfo? titleInfo, TitlePlan plan, int totalTitles, RipOptions options, IProgressTask ripProgress, HashSet<string> knownMkvs, CancellationToken cancellationToken)
     {
         // Reset ripProgress for this track (show 0-100% per track)
         ripProgress.Value = 0;
@@ -436,18 +509,18 @@ public class DiscRipper : IDiscRipper
         var msg = $"Ripping title {idx + 1} of {totalTitles}: {plan.DisplayName} (Title ID: {titleId}) [{DurationFormatter.Format(titleInfo?.DurationSeconds ?? 0)}]";
         ripProgress.AddMessage(msg);
 
-        var existingFiles = new HashSet<string>(Directory.EnumerateFiles(options.Temp!, "*.mkv"));
         var progressLogPath = Path.Combine(options.Temp!, $"progress_title_{titleId:D2}.log");
-        if (File.Exists(progressLogPath)) File.Delete(progressLogPath);
+        File.Delete(progressLogPath);
 
         string? rippedPath = null;
 
         var expectedBytes = titleInfo?.ReportedSizeBytes ?? 0;
         var durationSeconds = titleInfo?.DurationSeconds ?? 0;
         var rawLogPath = Path.Combine(options.Temp!, $"makemkv_title_{titleId:D2}.log");
-        var handler = new MakeMkvOutputHandler(expectedBytes, idx, totalTitles, null, progressLogPath, rawLogPath, _notifier, _theme);
+        using var handler = new MakeMkvOutputHandler(expectedBytes, idx, totalTitles, null,
+            options.Debug ? progressLogPath : null, rawLogPath, _notifier, _theme);
 
-        bool ripDone = false;
+        using var ripFinished = new CancellationTokenSource();
         double observedMaxBytes = 1; // prevent divide-by-zero
         double displayedFraction = 0;
         string? currentMkv = null;
@@ -456,19 +529,14 @@ public class DiscRipper : IDiscRipper
         var pollTask = Task.Run(async () =>
         {
             int pollCount = 0;
-            while (!ripDone)
+            long lastReported = -1;
+            while (!ripFinished.IsCancellationRequested)
             {
                 try
                 {
                     pollCount++;
-
-                    // Identify MKV being written if we haven't yet
-                    if (currentMkv == null)
-                    {
-                        currentMkv = Directory
-                            .EnumerateFiles(options.Temp!, "*.mkv")
-                            .FirstOrDefault(f => !existingFiles.Contains(f));
-                    }
+                    // Read the clock once per poll; every time-based fallback below uses the same value
+                    var elapsedSecs = DateTime.UtcNow.Subtract(ripStartTime).TotalSeconds;
 
                     // Prefer fraction parsed from PRGV when available
                     var fraction = Math.Clamp(handler.LastProgressFraction, 0, 1);
@@ -482,7 +550,6 @@ public class DiscRipper : IDiscRipper
                     // If MakeMKV never emits PRGV/bytes, fall back to elapsed time vs. title duration (best-effort)
                     if (fraction == 0 && durationSeconds > 0)
                     {
-                        var elapsedSecs = DateTime.UtcNow.Subtract(ripStartTime).TotalSeconds;
                         // Assume ~1x read speed with a little slack
                         var denom = Math.Max(10.0, durationSeconds * 1.2);
                         fraction = Math.Clamp(elapsedSecs / denom, 0, 1);
@@ -501,39 +568,47 @@ public class DiscRipper : IDiscRipper
                         fraction = displayedFraction;
                     }
 
-                    // As a last resort, use file size growth (monotonic) when we have no size estimate
-                    if (fraction == 0 && expectedBytes == 0 && currentMkv != null)
+                    // As a last resort, use file size growth (monotonic) when we have no size estimate.
+                    // The temp directory is only listed (once) and the file only stat'ed when this fallback is reached.
+                    if (fraction == 0 && expectedBytes == 0)
                     {
                         try
                         {
-                            var size = new FileInfo(currentMkv).Length;
-                            if (size > observedMaxBytes) observedMaxBytes = size;
-                            // Use relative growth (monotonic), capped so the bar moves but never hits 100% from this alone
-                            var candidate = observedMaxBytes > 0 ? size / observedMaxBytes : 0;
-                            displayedFraction = Math.Max(displayedFraction, Math.Clamp(candidate * 0.8, 0, 0.99));
-                            fraction = displayedFraction;
+                            currentMkv ??= FindRippedMkv(options.Temp!, titleId, knownMkvs);
+                            if (currentMkv != null)
+                            {
+                                var size = new FileInfo(currentMkv).Length;
+                                if (size > observedMaxBytes) observedMaxBytes = size;
+                                // Use relative growth (monotonic), capped so the bar moves but never hits 100% from this alone
+                                var candidate = observedMaxBytes > 0 ? size / observedMaxBytes : 0;
+                                displayedFraction = Math.Max(displayedFraction, Math.Clamp(candidate * 0.8, 0, 0.99));
+                                fraction = displayedFraction;
+                            }
                         }
-                        catch { }
+                        catch (IOException) { }
                     }
 
                     // If rip has been running for a while but no progress yet, show minimal progress to indicate activity
-                    if (fraction == 0 && DateTime.UtcNow.Subtract(ripStartTime).TotalSeconds > 3)
+                    if (fraction == 0 && elapsedSecs > 3)
                     {
-                        var elapsedSecs = DateTime.UtcNow.Subtract(ripStartTime).TotalSeconds;
                         var minimalFraction = Math.Min(0.1, elapsedSecs / 60.0); // nudge up to 10% over a minute
                         displayedFraction = Math.Max(displayedFraction, minimalFraction);
                         fraction = displayedFraction;
                     }
 
                     var fractionalProgress = (long)Math.Round(fraction * RipProgressScale);
-                    ripProgress.Value = fractionalProgress; // Show only current track progress (0-100%)
+                    if (fractionalProgress != lastReported)
+                    {
+                        ripProgress.Value = fractionalProgress; // Show only current track progress (0-100%)
+                        lastReported = fractionalProgress;
+                    }
 
                 }
                 catch (Exception ex)
                 {
                     _notifier.Error($"Rip progress polling error: {ex.Message}");
                 }
-                await Task.Delay(500);
+                await WaitForNextPollAsync(TimeSpan.FromMilliseconds(500), ripFinished.Token);
             }
         });
 
@@ -541,13 +616,14 @@ public class DiscRipper : IDiscRipper
             onOutput: handler.HandleLine,
             onError: errLine =>
             {
-                if (!(errLine.StartsWith("PRGV:") || errLine.StartsWith("PRGC:")))
+                if (!MakeMkvProtocol.IsProgressLine(errLine))
                 {
                     _notifier.Error(errLine);
                 }
                 handler.HandleLine(errLine);
-            });
-        ripDone = true;
+            },
+            ct: cancellationToken);
+        ripFinished.Cancel();
         try
         {
             await pollTask;
@@ -558,94 +634,114 @@ public class DiscRipper : IDiscRipper
         }
         if (exit == 0)
         {
-            var newFiles = Directory.EnumerateFiles(options.Temp!, "*.mkv").Where(f => !existingFiles.Contains(f)).ToList();
-            if (newFiles.Count > 0)
-            {
-                rippedPath = newFiles.OrderByDescending(File.GetCreationTime).First();
-            }
+            rippedPath = FindRippedMkv(options.Temp!, titleId, knownMkvs);
         }
+        RememberRipOutput(options.Temp!, knownMkvs, rippedPath);
 
         // Snap progress to the completed title
         ripProgress.Value = RipProgressScale; // Show 100% for current track
         return rippedPath;
     }
 
-    private async Task EncodeConsumerAsync(Channel<RipJob> ripChannel, Channel<EncodeResult> resultChannel, IReadOnlyList<TitlePlan> titlePlans, ContentMetadata metadata, RipOptions options, IProgressTask encodeProgress, OverallProgressTracker overallTracker, CancellationToken cancellationToken)
+    // Sleeps between progress polls, but wakes as soon as the rip finishes so the caller is not left waiting out the interval
+    private static async Task WaitForNextPollAsync(TimeSpan interval, CancellationToken ripFinished)
     {
         try
         {
-            var totalTitles = titlePlans.Count;
-            int processedCount = 0;
-            var planLookup = titlePlans.ToDictionary(p => p.TitleId);
+            await Task.Delay(interval, ripFinished);
+        }
+        catch (OperationCanceledException) { }
+    }
 
-            await foreach (var ripJob in ripChannel.Reader.ReadAllAsync(cancellationToken))
-            {
-                processedCount++;
+    // Splits the cores between concurrent encodes so they do not oversubscribe the CPU; 0 leaves a lone encode to ffmpeg's default
+    private static int ThreadsPerEncode(RipOptions options) =>
+        options.EncodeJobs > 1 ? Math.Max(1, Environment.ProcessorCount / options.EncodeJobs) : 0;
 
-                if (!planLookup.TryGetValue(ripJob.TitleId, out var plan))
-                {
-                    await resultChannel.Writer.WriteAsync(new EncodeResult(ripJob.TitleId, false, ErrorMessage: $"Missing plan for title {ripJob.TitleId}"), cancellationToken);
-                    overallTracker.MarkEncodeComplete();
-                    continue;
-                }
+    // Encodes of different titles are independent, so --encode-jobs consumers may drain the rip channel side by side
+    private async Task RunEncodeConsumersAsync(Channel<RipJob> ripChannel, Channel<EncodeResult> resultChannel, IReadOnlyList<TitlePlan> titlePlans, ContentMetadata metadata, RipOptions options, IProgressTask encodeProgress, OverallProgressTracker overallTracker, CancellationToken cancellationToken)
+    {
+        try
+        {
+            var consumerCount = Math.Max(1, options.EncodeJobs);
+            var planLookup = titlePlans.ToDictionary(p => p.TitleId);
+            await Task.WhenAll(Enumerable.Range(0, consumerCount).Select(_ => Task.Run(() =>
+                EncodeConsumerAsync(ripChannel, resultChannel, titlePlans.Count, planLookup, metadata, options, encodeProgress, consumerCount == 1, overallTracker, cancellationToken))));
 
-                var outputPath = plan.TempOutputPath;
-                var versionSuffix = plan.VersionSuffix;
-                var episodeNum = plan.EpisodeNum;
+            // Ensure the encoding bar completes
+            encodeProgress.Value = encodeProgress.MaxValue;
+            overallTracker.MarkAllComplete();
+        }
+        finally
+        {
+            resultChannel.Writer.Complete();
+        }
+    }
 
-                if (File.Exists(outputPath)) File.Delete(outputPath);
+    private async Task EncodeConsumerAsync(Channel<RipJob> ripChannel, Channel<EncodeResult> resultChannel, int totalTitles, IReadOnlyDictionary<int, TitlePlan> planLookup, ContentMetadata metadata, RipOptions options, IProgressTask encodeProgress, bool ownsEncodeProgress, OverallProgressTracker overallTracker, CancellationToken cancellationToken)
+    {
+        await foreach (var ripJob in ripChannel.Reader.ReadAllAsync(cancellationToken))
+        {
+            var processedCount = overallTracker.StartEncode();
 
-                // Reset encodeProgress for this job (show 0-100% per encode)
-                encodeProgress.Value = 0;
-                encodeProgress.ClearMessages(); // Clear messages from previous encoding
+            if (!planLookup.TryGetValue(ripJob.TitleId, out var plan))
+            {
+                await resultChannel.Writer.WriteAsync(new EncodeResult(ripJob.TitleId, false, ErrorMessage: $"Missing plan for title {ripJob.TitleId}"), cancellationToken);
+                overallTracker.MarkEncodeComplete();
+                continue;
+            }
 
-                var encMsg = $"Encoding ({processedCount}/{totalTitles}): {plan.FinalFileName}";
-                encodeProgress.AddMessage(encMsg);
+            var outputPath = plan.TempOutputPath;
+            var versionSuffix = plan.VersionSuffix;
+            var episodeNum = plan.EpisodeNum;
 
-                // Perform encoding
-                var success = await _encoder.EncodeAsync(
-                    ripJob.RippedFilePath,
-                    outputPath,
-                    includeEnglishSubtitles: true,
-                    ordinal: processedCount,
-                    total: totalTitles,
-                    progressTask: encodeProgress);
+            File.Delete(outputPath);
 
-                if (success)
-                {
-                    // Rename to final output
-                    var finalPath = FileNaming.RenameFile(
-                        outputPath, metadata, episodeNum,
-                        options.Season, versionSuffix, plan.EpisodeTitle);
-
-                    await resultChannel.Writer.WriteAsync(new EncodeResult(
-                        ripJob.TitleId,
-                        true,
-                        finalPath), cancellationToken);
-                    encodeProgress.Value = RipProgressScale; // Show 100% for current encode
-                    overallTracker.MarkEncodeComplete();
-                }
-                else
-                {
-                    await resultChannel.Writer.WriteAsync(new EncodeResult(
-                        ripJob.TitleId,
-                        false,
-                        ErrorMessage: $"Failed to encode title {ripJob.TitleId}"), cancellationToken);
-                    encodeProgress.Value = RipProgressScale; // Show 100% even on failure
-                    overallTracker.MarkEncodeComplete();
-                }
+            // A single consumer shows 0-100% per encode; concurrent encodes share the bar, which then counts finished encodes
+            if (ownsEncodeProgress)
+            {
+                encodeProgress.Value = 0;
+                encodeProgress.ClearMessages(); // Clear messages from previous encoding
             }
 
-            // Ensure the encoding bar completes if it was created
-            if (encodeProgress != null)
+            var encMsg = $"Encoding ({processedCount}/{totalTitles}): {plan.FinalFileName}";
+            encodeProgress.AddMessage(encMsg);
+
+            // Analysis was started by the producer as soon as the rip finished, overlapping the previous encode
+            var analysis = await ripJob.Analysis;
+            var success = analysis != null && await _encoder.EncodeAsync(
+                analysis,
+                ripJob.RippedFilePath,
+                outputPath,
+                includeEnglishSubtitles: true,
+                ordinal: processedCount,
+                total: totalTitles,
+                progressTask: ownsEncodeProgress ? encodeProgress : null,
+                threads: ThreadsPerEncode(options),
+                ct: cancellationToken);
+
+            if (success)
             {
-                encodeProgress.Value = encodeProgress.MaxValue;
-                overallTracker.MarkAllComplete();
+                // Rename to final output
+                var finalPath = FileNaming.RenameFile(
+                    outputPath, metadata, episodeNum,
+                    options.Season, versionSuffix, plan.EpisodeTitle);
+
+                await resultChannel.Writer.WriteAsync(new EncodeResult(
+                    ripJob.TitleId,
+                    true,
+                    finalPath), cancellationToken);
             }
-        }
-        finally
-        {
-            resultChannel.Writer.Complete();
+            else
+            {
+                await resultChannel.Writer.WriteAsync(new EncodeResult(
+                    ripJob.TitleId,
+                    false,
+                    ErrorMessage: $"Failed to encode title {ripJob.TitleId}"), cancellationToken);
+            }
+
+            // Show 100% for the current encode (even on failure), or the share of encodes finished when running several
+            var completedEncodes = overallTracker.MarkEncodeComplete();
+            encodeProgress.Value = ownsEncodeProgress ? RipProgressScale : (long)completedEncodes * RipProgressScale / Math.Max(1, totalTitles);
         }
     }
 
@@ -655,6 +751,7 @@ public class DiscRipper : IDiscRipper
         private readonly object _lock = new();
         private int _completedRips;
         private int _completedEncodes;
+        private int _startedEncodes;
 
         public OverallProgressTracker(IProgressTask overallTask)
         {
@@ -670,12 +767,15 @@ public class DiscRipper : IDiscRipper
             }
         }
 
-        public void MarkEncodeComplete()
+        public int StartEncode() => Interlocked.Increment(ref _startedEncodes);
+
+        public int MarkEncodeComplete()
         {
             lock (_lock)
             {
                 _completedEncodes++;
                 UpdateValue();
+                return _completedEncodes;
             }
         }
 
@@ -699,16 +799,20 @@ public class DiscRipper : IDiscRipper
         return $"Ripping complete: {rippedCount}/{totalTitles} tracks in {durationText}.";
     }
 
-    private async Task<List<string>> CollectResultsAsync(Channel<EncodeResult> resultChannel, int expectedCount, CancellationToken cancellationToken)
+    private async Task<List<string>> CollectResultsAsync(Channel<EncodeResult> resultChannel, List<int> titleIds, CancellationToken cancellationToken)
     {
-        var finalFiles = new List<string>();
+        // Concurrent encodes can finish out of order, so keep files in title order
+        var titlePositions = new Dictionary<int, int>(titleIds.Count);
+        for (var i = 0; i < titleIds.Count; i++)
+            titlePositions.TryAdd(titleIds[i], i);
+        var finalFiles = new SortedList<int, string>();
         var errors = new List<string>();
 
         await foreach (var result in resultChannel.Reader.ReadAllAsync(cancellationToken))
         {
             if (result.Success && result.FinalPath != null)
             {
-                finalFiles.Add(result.FinalPath);
+                finalFiles[titlePositions[result.TitleId]] = result.FinalPath;
             }
             else
             {
@@ -722,56 +826,70 @@ public class DiscRipper : IDiscRipper
             _notifier.Warning($"{errors.Count} title(s) failed to encode");
         }
 
-        return finalFiles;
+        return finalFiles.Values.ToList();
     }
 
-    private async Task<List<string>> EncodeAndRenameAsync(DiscInfo discInfo, List<int> titleIds, Dictionary<int, string> rippedFilesMap, ContentMetadata? metadata, RipOptions options)
+    private async Task<List<string>> EncodeAndRenameAsync(DiscInfo discInfo, List<int> titleIds, Dictionary<int, string> rippedFilesMap, ContentMetadata? metadata, RipOptions options, CancellationToken cancellationToken)
     {
+        // Results are slotted by title index so output order is stable regardless of completion order
+        var results = new string?[titleIds.Count];
+        var titlesById = discInfo.TitlesById;
+        var parallelOptions = new ParallelOptions { MaxDegreeOfParallelism = Math.Max(1, options.EncodeJobs), CancellationToken = cancellationToken };
+
+        await Parallel.ForEachAsync(Enumerable.Range(0, titleIds.Count), parallelOptions, async (idx, ct) =>
+        {
+            results[idx] = await EncodeAndRenameTitleAsync(titlesById, titleIds, idx, rippedFilesMap, metadata, options, ct);
+        });
+
         var finalFiles = new List<string>();
-        foreach (var titleId in titleIds)
+        foreach (var final in results)
         {
-            if (!rippedFilesMap.TryGetValue(titleId, out var src))
-            {
-                _notifier.Error($"No ripped file found for title {titleId}");
-                continue;
-            }
+            if (final != null) finalFiles.Add(final);
+        }
+        return finalFiles;
+    }
 
-            var titleInfo = discInfo.Titles.FirstOrDefault(t => t.Id == titleId);
-            var titleName = titleInfo?.Name;
-            string outputName;
-            string? versionSuffix = null;
+    private async Task<string?> EncodeAndRenameTitleAsync(IReadOnlyDictionary<int, TitleInfo> titlesById, List<int> titleIds, int idx, Dictionary<int, string> rippedFilesMap, ContentMetadata? metadata, RipOptions options, CancellationToken cancellationToken)
+    {
+        var titleId = titleIds[idx];
+        if (!rippedFilesMap.TryGetValue(titleId, out var src))
+        {
+            _notifier.Error($"No ripped file found for title {titleId}");
+            return null;
+        }
 
-            if (options.Tv)
-            {
-                var episodeIdx = titleIds.IndexOf(titleId);
-                var episodeNum = (options.EpisodeStart - 1) + episodeIdx + 1;
-                outputName = Path.Combine(options.Output, $"temp_s{options.Season:00}e{episodeNum:00}.mkv");
-            }
-            else
-            {
-                var ordinal = titleIds.IndexOf(titleId) + 1;
-                var safeTitle = !string.IsNullOrWhiteSpace(titleName) ? FileNaming.SanitizeFileName(titleName!) : $"movie_{ordinal}";
-                var includeSuffix = titleIds.Count > 1;
-                versionSuffix = includeSuffix ? $" - title{ordinal:D2}" : null;
-                var safeVersionSuffix = string.IsNullOrWhiteSpace(versionSuffix) ? "" : FileNaming.SanitizeFileName(versionSuffix);
-                outputName = Path.Combine(options.Output, $"{safeTitle}{safeVersionSuffix}.mkv");
-            }
-            if (File.Exists(outputName)) File.Delete(outputName);
+        var titleInfo = titlesById.GetValueOrDefault(titleId);
+        var titleName = titleInfo?.Name;
+        string outputName;
+        string? versionSuffix = null;
 
-            if (await _encoder.EncodeAsync(src, outputName, includeEnglishSubtitles: true, ordinal: titleIds.IndexOf(titleId) + 1, total: titleIds.Count))
-            {
-                var episodeIdx = options.Tv ? titleIds.IndexOf(titleId) : (int?)null;
-                var episodeNum = episodeIdx.HasValue ? (options.EpisodeStart - 1) + episodeIdx.Value + 1 : (int?)null;
-                string? episodeTitle = null;
-                if (options.Tv && episodeNum.HasValue)
-                {
-                    episodeTitle = await _episodeTitles.GetEpisodeTitleAsync(metadata!.Title, options.Season, episodeNum.Value, metadata.Year);
-                }
-                var final = FileNaming.RenameFile(outputName, metadata!, episodeNum, options.Season, versionSuffix, episodeTitle);
-                finalFiles.Add(final);
-            }
+        if (options.Tv)
+        {
+            var episodeNum = (options.EpisodeStart - 1) + idx + 1;
+            outputName = Path.Combine(options.Output, $"temp_s{options.Season:00}e{episodeNum:00}.mkv");
         }
-        return finalFiles;
+        else
+        {
+            var ordinal = idx + 1;
+            var safeTitle = !string.IsNullOrWhiteSpace(titleName) ? FileNaming.SanitizeFileName(titleName!) : $"movie_{ordinal}";
+            var includeSuffix = titleIds.Count > 1;
+            versionSuffix = includeSuffix ? $" - title{ordinal:D2}" : null;
+            var safeVersionSuffix = string.IsNullOrWhiteSpace(versionSuffix) ? "" : FileNaming.SanitizeFileName(versionSuffix);
+            outputName = Path.Combine(options.Output, $"{safeTitle}{safeVersionSuffix}.mkv");
+        }
+        File.Delete(outputName);
+
+        if (!await _encoder.EncodeAsync(src, outputName, includeEnglishSubtitles: true, ordinal: idx + 1, total: titleIds.Count, threads: ThreadsPerEncode(options), ct: cancellationToken))
+            return null;
+
+        var episodeIdx = options.Tv ? idx : (int?)null;
+        var episodeNumber = episodeIdx.HasValue ? (options.EpisodeStart - 1) + episodeIdx.Value + 1 : (int?)null;
+        string? episodeTitle = null;
+        if (options.Tv && episodeNumber.HasValue)
+        {
+            episodeTitle = await _episodeTitles.GetEpisodeTitleAsync(metadata!.Title, options.Season, episodeNumber.Value, metadata.Year);
+        }
+        return FileNaming.RenameFile(outputName, metadata!, episodeNumber, options.Season, versionSuffix, episodeTitle);
     }
 
     private void CleanupTempDirectory(RipOptions options)
@@ -801,7 +919,7 @@ public class DiscRipper : IDiscRipper
             Directory.Delete(tempPath, recursive: true);
             _notifier.Muted($"Cleaned up temporary rip files at {tempPath}");
         }
-        catch (Exception ex)
+        catch (Exception ex) when (ex is IOException or UnauthorizedAccessException)
         {
             _notifier.Warning($"Failed to clean up temp directory '{tempPath}': {ex.Message}");
         }
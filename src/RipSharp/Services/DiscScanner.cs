@@ -1,5 +1,3 @@
-using System.Text.RegularExpressions;
-
 namespace BugZapperLabs.RipSharp.Services;
 
 public class DiscScanner : IDiscScanner
@@ -51,54 +49,24 @@ public class DiscScanner : IDiscScanner
 
     public List<int> IdentifyMainContent(DiscInfo info, bool isTv)
     {
-        var ids = new List<int>();
+        const int episodeMinSeconds = 20 * 60;
+        const int episodeMaxSeconds = 60 * 60;
+        // Include only tracks of 30 minutes or more (theatrical, extended, director's cut, etc.)
+        // This captures main versions while excluding short extras
+        const int movieMinSeconds = 30 * 60;
+
+        var minSeconds = isTv ? episodeMinSeconds : movieMinSeconds;
+        var maxSeconds = isTv ? episodeMaxSeconds : int.MaxValue;
+
         var titles = info.Titles;
-        if (titles.Count == 0) return ids;
-        if (isTv)
+        var ids = new List<int>(titles.Count);
+        foreach (var t in titles)
         {
-            foreach (var t in titles)
-            {
-                if (t.DurationSeconds >= 20 * 60 && t.DurationSeconds <= 60 * 60)
-                    ids.Add(t.Id);
-            }
-            ids.Sort();
-            return ids;
+            if (t.DurationSeconds >= minSeconds && t.DurationSeconds <= maxSeconds)
+                ids.Add(t.Id);
         }
-        else
-        {
-            // Include only tracks longer than 30 minutes (theatrical, extended, director's cut, etc.)
-            // This captures main versions while excluding short extras
-            foreach (var t in titles)
-            {
-                var minutes = t.DurationSeconds / 60;
-                if (minutes >= 30)
-                    ids.Add(t.Id);
-            }
-            ids.Sort();
-            return ids;
-        }
-    }
-
-    private static int ParseDurationToSeconds(string? s)
-    {
-        if (string.IsNullOrEmpty(s)) return 0;
-        var parts = s.Split(':');
-        if (parts.Length == 3 && int.TryParse(parts[0], out var h) && int.TryParse(parts[1], out var m) && int.TryParse(parts[2], out var sec))
-            return h * 3600 + m * 60 + sec;
-        return 0;
-    }
-
-    private static bool TryParseBytes(string? s, out long bytes)
-    {
-        bytes = 0;
-        if (string.IsNullOrEmpty(s)) return false;
-        // Very rough parser, expects number followed by unit
-        var m = Regex.Match(s, @"([0-9]+) (MB|GB)");
-        if (!m.Success) return false;
-        var val = long.Parse(m.Groups[1].Value);
-        var unit = m.Groups[2].Value;
-        bytes = unit == "GB" ? val * 1024L * 1024L * 1024L : val * 1024L * 1024L;
-        return true;
+        ids.Sort();
+        return ids;
     }
 
     private static string NormalizeDiscType(string? raw) => raw?.ToLowerInvariant() switch
@@ -85,20 +85,34 @@ public class DiscTypeDetector : IDiscTypeDetector
         const int tvMaxSeconds = 3300;                  // 55 min
         const int movieFeatureSeconds = 4800;           // 80 min main feature indicator
 
-        var shortTitles = titles.Where(t => t.DurationSeconds <= shortCutoffSeconds).ToList();
-        var tvLikely = titles.Where(t => t.DurationSeconds >= tvMinSeconds && t.DurationSeconds <= tvMaxSeconds).ToList();
-        var longTitles = titles.Where(t => t.DurationSeconds > movieFeatureSeconds).ToList();
+        // Bucket every title in one pass; only the TV-length and substantial durations are needed beyond counts
+        var shortCount = 0;
+        var longCount = 0;
+        var tvDurations = new List<int>(titles.Count);
+        var substDurations = new List<int>(titles.Count);
+        foreach (var t in titles)
+        {
+            var duration = t.DurationSeconds;
+            if (duration <= shortCutoffSeconds)
+                shortCount++;
+            else
+                substDurations.Add(duration);
+
+            if (duration >= tvMinSeconds && duration <= tvMaxSeconds)
+                tvDurations.Add(duration);
+            if (duration > movieFeatureSeconds)
+                longCount++;
+        }
 
         // Heuristic: strong TV signal when most titles cluster in TV episode range with low variation
-        if (tvLikely.Count >= 3 && tvLikely.Count >= titles.Count * 0.6)
+        if (tvDurations.Count >= 3 && tvDurations.Count >= titles.Count * 0.6)
         {
-            var tvDurations = tvLikely.Select(t => t.DurationSeconds).ToList();
             var tvAvg = tvDurations.Average();
 
             // Guard against division by zero
             if (tvAvg > 0)
             {
-                var tvStdDev = Math.Sqrt(CalculateVariance(tvDurations));
+                var tvStdDev = Math.Sqrt(CalculateVariance(tvDurations, tvAvg));
                 var cv = tvStdDev / tvAvg; // coefficient of variation
 
                 if (cv < 0.15)
@@ -114,28 +128,26 @@ public class DiscTypeDetector : IDiscTypeDetector
         }
 
         // If there is one very long title and many shorts, likely a movie with bonus content
-        if (longTitles.Count == 1 && shortTitles.Count >= 2 && titles.Count >= 4)
+        if (longCount == 1 && shortCount >= 2 && titles.Count >= 4)
         {
             return (false, 0.85);
         }
 
         // If there are 2 long titles and few tv-length titles, treat as movie (alt cuts)
-        if (longTitles.Count == 2 && tvLikely.Count <= 1)
+        if (longCount == 2 && tvDurations.Count <= 1)
         {
             return (false, 0.75);
         }
 
         // If all titles are substantial (no shorts) and low variance overall, lean TV
-        var substantial = titles.Where(t => t.DurationSeconds > shortCutoffSeconds).ToList();
-        if (substantial.Count >= 3 && shortTitles.Count == 0)
+        if (substDurations.Count >= 3 && shortCount == 0)
         {
-            var substDurations = substantial.Select(t => t.DurationSeconds).ToList();
             var avg = substDurations.Average();
 
             // Guard against division by zero
             if (avg > 0)
             {
-                var stdDev = Math.Sqrt(CalculateVariance(substDurations));
+                var stdDev = Math.Sqrt(CalculateVariance(substDurations, avg));
                 var cv = stdDev / avg;
 
                 if (cv < 0.18)
@@ -146,7 +158,7 @@ public class DiscTypeDetector : IDiscTypeDetector
         }
 
         // Movie default when many shorts and few substantial titles
-        if (shortTitles.Count >= 3 && substantial.Count <= 2)
+        if (shortCount >= 3 && substDurations.Count <= 2)
         {
             return (false, 0.7);
         }
@@ -156,16 +168,19 @@ public class DiscTypeDetector : IDiscTypeDetector
     }
 
     /// <summary>
-    /// Calculates the variance of a collection of values.
+    /// Calculates the variance of a list of values around their already-computed mean.
     /// </summary>
-    private double CalculateVariance(IEnumerable<int> values)
+    private static double CalculateVariance(List<int> values, double mean)
     {
-        var valueList = values.ToList();
-        if (valueList.Count == 0)
+        if (values.Count == 0)
             return 0.0;
 
-        var mean = valueList.Average();
-        var squaredDiffs = valueList.Select(v => Math.Pow(v - mean, 2));
-        return squaredDiffs.Average();
+        var sumSquaredDiffs = 0.0;
+        foreach (var v in values)
+        {
+            var diff = v - mean;
+            sumSquaredDiffs += diff * diff;
+        }
+        return sumSquaredDiffs / values.Count;
     }
 }
@@ -4,20 +4,32 @@ namespace BugZapperLabs.RipSharp.Services;
 
 public class EncoderService : IEncoderService
 {
+    private const int ErrorTailLines = 10;
+    private const string ProbeEntries = "format=duration:stream=index,codec_type,codec_name,channels,width,height:stream_tags=language";
+
     private readonly IProcessRunner _runner;
+    private readonly IConsoleWriter _notifier;
 
     public EncoderService(IProcessRunner runner, IConsoleWriter notifier, IProgressDisplay progressDisplay)
     {
         _runner = runner;
+        _notifier = notifier;
     }
 
     public async Task<MediaFileAnalysis?> AnalyzeAsync(string filePath)
     {
-        var json = new System.Text.StringBuilder();
-        var exit = await _runner.RunAsync("ffprobe", $"-v quiet -print_format json -show_streams -show_format \"{filePath}\"",
-            onOutput: line => json.AppendLine(line));
-        if (exit != 0) return null;
-        var doc = JsonDocument.Parse(json.ToString());
+        // Parse ffprobe's UTF-8 output straight off the pipe rather than collecting it line by line
+        JsonDocument? parsed = null;
+        // MakeMKV writes the stream layout, languages and duration into the MKV header, so a short probe is enough here.
+        // Only the fields read below are requested, which keeps ffprobe's output (and the parse) small.
+        var exit = await _runner.RunWithOutputStreamAsync("ffprobe", $"-v quiet -analyzeduration 1000000 -probesize 5000000 -print_format json -show_entries {ProbeEntries} \"{filePath}\"",
+            readOutput: async stdout =>
+            {
+                try { parsed = await JsonDocument.ParseAsync(stdout); }
+                catch (JsonException) { } // ffprobe prints nothing useful on failure; the exit code decides
+            });
+        using var doc = parsed;
+        if (exit != 0 || doc == null) return null;
         var streams = new List<MediaStream>();
         double? durationSeconds = null;
 
@@ -46,34 +58,65 @@ public class EncoderService : IEncoderService
         return new MediaFileAnalysis { Streams = streams, DurationSeconds = durationSeconds };
     }
 
-    public async Task<bool> EncodeAsync(string inputFile, string outputFile, bool includeEnglishSubtitles, int ordinal, int total, IProgressTask? progressTask = null)
+    public async Task<bool> EncodeAsync(string inputFile, string outputFile, bool includeEnglishSubtitles, int ordinal, int total, IProgressTask? progressTask = null, int threads = 0, CancellationToken ct = default)
     {
         var analysis = await AnalyzeAsync(inputFile);
         if (analysis == null) return false;
 
+        return await EncodeAsync(analysis, inputFile, outputFile, includeEnglishSubtitles, ordinal, total, progressTask, threads, ct);
+    }
+
+    public async Task<bool> EncodeAsync(MediaFileAnalysis analysis, string inputFile, string outputFile, bool includeEnglishSubtitles, int ordinal, int total, IProgressTask? progressTask = null, int threads = 0, CancellationToken ct = default)
+    {
         var selected = SelectStreams(analysis, includeEnglishSubtitles);
-        var ffmpegArgs = BuildFfmpegArguments(inputFile, outputFile, selected);
+        var ffmpegArgs = BuildFfmpegArguments(inputFile, outputFile, selected, threads);
 
         var durationSeconds = analysis.DurationSeconds ?? 0;
         var durationTicks = (long)(durationSeconds * TimeSpan.TicksPerSecond);
 
+        // Only the last few diagnostic lines are kept for the failure report; progress lines are parsed and dropped
+        var errorTail = new Queue<string>(ErrorTailLines);
         var exit = await _runner.RunAsync("ffmpeg", ffmpegArgs,
             onOutput: _ => { },  // ffmpeg stdout - not used with -progress pipe:2
-            onError: line => HandleEncodingProgress(line, progressTask, durationTicks)); // Parse progress from stderr
+            onError: line =>
+            {
+                if (IsProgressLine(line))
+                {
+                    HandleEncodingProgress(line, progressTask, durationTicks); // Parse progress from stderr
+                    return;
+                }
+                if (errorTail.Count == ErrorTailLines) errorTail.Dequeue();
+                errorTail.Enqueue(line);
+            },
+            ct: ct);
+        ct.ThrowIfCancellationRequested(); // a killed ffmpeg is an interruption, not a failed encode
+
+        if (exit != 0)
+        {
+            _notifier.Error($"ffmpeg exited with code {exit} while encoding {Path.GetFileName(inputFile)}");
+            foreach (var line in errorTail)
+                _notifier.Error(line);
+        }
 
         return exit == 0;
     }
 
+    // -progress writes bare "key=value" lines; ffmpeg's own warnings and errors are free text
+    private static bool IsProgressLine(string line)
+    {
+        var equals = line.IndexOf('=');
+        return equals > 0 && line.AsSpan(0, equals).IndexOfAny(' ', '[') < 0;
+    }
+
     private void HandleEncodingProgress(string line, IProgressTask? task, long durationTicks)
     {
         if (task == null) return;
 
         // Progress lines come in key=value format on stderr
         // Use out_time_us (microseconds) for accurate progress tracking
-        if (line.StartsWith("out_time_us="))
+        if (line.StartsWith("out_time_us=", StringComparison.Ordinal))
         {
-            var timeStr = line.Substring("out_time_us=".Length).Trim();
-            if (double.TryParse(timeStr, out var timeUs))
+            if (double.TryParse(line.AsSpan("out_time_us=".Length).Trim(), out var timeUs))
             {
                 var currentTimeMs = timeUs / 1000.0;  // Convert microseconds to milliseconds
                 var timeTicks = (long)(currentTimeMs * TimeSpan.TicksPerMillisecond);
@@ -82,47 +125,73 @@ public class EncoderService : IEncoderService
         }
     }
 
-    private static MediaStream? ChooseBestVideo(List<MediaStream> streams)
-    {
-        MediaStream? best = null;
-        foreach (var v in streams)
-        {
-            if (v.CodecType != "video") continue;
-            if (best == null) best = v;
-            else
-            {
-                int bestPixels = (best.Width ?? 0) * (best.Height ?? 0);
-                int curPixels = (v.Width ?? 0) * (v.Height ?? 0);
-                if (curPixels > bestPixels) best = v;
-            }
-        }
-        return best;
-    }
-
     private record SelectedStreams(
         MediaStream? Video,
         List<MediaStream> Audio,
-        List<MediaStream> Subtitles);
+        List<MediaStream> Subtitles,
+        bool KeepsEveryInputStream);
 
     private static SelectedStreams SelectStreams(MediaFileAnalysis analysis, bool includeEnglishSubtitles)
     {
-        var streams = analysis.Streams;
-        var video = ChooseBestVideo(streams);
+        MediaStream? video = null;
+        var bestPixels = 0;
+        var audioStreams = new List<MediaStream>();
+        var subtitleStreams = new List<MediaStream>();
 
-        // Filter to only English audio tracks
-        var audioStreams = streams.FindAll(s => s.CodecType == "audio" &&
-            (s.Language == null || s.Language == "eng" || s.Language == "en"));
+        // "-map 0" is equivalent when every input stream is kept and the input already lists video, then audio,
+        // then subtitles; track both conditions during the same pass
+        var keepsEveryInputStream = true;
+        var lastGroup = 0;
+
+        // Classify every stream in a single pass
+        foreach (var s in analysis.Streams)
+        {
+            bool kept;
+            int group;
+            switch (s.CodecType)
+            {
+                case "video":
+                    // Keep the highest-resolution video stream (first one wins on ties); a second video stream always drops one
+                    var pixels = (s.Width ?? 0) * (s.Height ?? 0);
+                    kept = video == null;
+                    if (video == null || pixels > bestPixels)
+                    {
+                        video = s;
+                        bestPixels = pixels;
+                    }
+                    group = 0;
+                    break;
+                case "audio":
+                    // Only English (or unspecified) audio tracks
+                    kept = IsEnglishOrUnspecified(s.Language);
+                    if (kept)
+                        audioStreams.Add(s);
+                    group = 1;
+                    break;
+                case "subtitle":
+                    // When English subtitles are requested, English (or unspecified) subtitle tracks
+                    kept = includeEnglishSubtitles && IsEnglishOrUnspecified(s.Language);
+                    if (kept)
+                        subtitleStreams.Add(s);
+                    group = 2;
+                    break;
+                default:
+                    kept = false;
+                    group = lastGroup;
+                    break;
+            }
 
-        // When English subtitles are requested, filter to English (or unspecified) subtitle tracks
-        var subtitleStreams = includeEnglishSubtitles
-            ? streams.FindAll(s => s.CodecType == "subtitle" &&
-                (s.Language == null || s.Language == "eng" || s.Language == "en"))
-            : new List<MediaStream>();
+            keepsEveryInputStream &= kept && group >= lastGroup;
+            lastGroup = group;
+        }
 
-        return new SelectedStreams(video, audioStreams, subtitleStreams);
+        return new SelectedStreams(video, audioStreams, subtitleStreams, keepsEveryInputStream);
     }
 
-    private static string BuildFfmpegArguments(string inputFile, string outputFile, SelectedStreams selected)
+    private static bool IsEnglishOrUnspecified(string? language) =>
+        language == null || language == "eng" || language == "en";
+
+    private static string BuildFfmpegArguments(string inputFile, string outputFile, SelectedStreams selected, int threads)
     {
         var args = new System.Text.StringBuilder();
 
@@ -130,23 +199,34 @@ public class EncoderService : IEncoderService
         args.Append("-probesize 400M -analyzeduration 400M ");
         args.Append($"-i \"{inputFile}\" ");
 
-        // Map the selected video first
-        if (selected.Video != null)
-            args.Append($"-map 0:{selected.Video.Index} ");
+        if (selected.KeepsEveryInputStream)
+        {
+            args.Append("-map 0 ");
+        }
+        else
+        {
+            // Map the selected video first
+            if (selected.Video != null)
+                args.Append($"-map 0:{selected.Video.Index} ");
 
-        // Map every audio stream to preserve languages and commentaries
-        foreach (var a in selected.Audio)
-            args.Append($"-map 0:{a.Index} ");
+            // Map every audio stream to preserve languages and commentaries
+            foreach (var a in selected.Audio)
+                args.Append($"-map 0:{a.Index} ");
 
-        // Map subtitles when requested
-        foreach (var s in selected.Subtitles)
-            args.Append($"-map 0:{s.Index} ");
+            // Map subtitles when requested
+            foreach (var s in selected.Subtitles)
+                args.Append($"-map 0:{s.Index} ");
+        }
 
         args.Append("-map_chapters 0 ");
 
         // Video encoding per HandBrake mkv preset (x264, slow, CRF 22, decomb equivalent)
         args.Append("-c:v libx264 -preset slow -crf 22 -pix_fmt yuv420p -vf bwdif=mode=send_frame:parity=auto:deint=interlaced ");
 
+        // When several encodes run at once each gets a share of the cores; otherwise x264 picks its own thread count
+        if (threads > 0)
+            args.Append($"-threads {threads} ");
+
         // Audio: copy AAC/AC3/EAC3, otherwise transcode to AAC 512k
         int audioOut = 0;
         foreach (var a in selected.Audio)
@@ -4,23 +4,29 @@ namespace BugZapperLabs.RipSharp.Services;
 
 public class ProcessRunner : IProcessRunner
 {
+    private readonly IToolPathResolver _toolPaths;
+
+    public ProcessRunner(IToolPathResolver toolPaths)
+    {
+        _toolPaths = toolPaths;
+    }
+
     public async Task<int> RunAsync(string fileName, string arguments, Action<string>? onOutput = null, Action<string>? onError = null, CancellationToken ct = default)
     {
         var psi = new ProcessStartInfo
         {
-            FileName = fileName,
+            FileName = ResolveExecutable(fileName),
             Arguments = arguments,
             RedirectStandardOutput = true,
             RedirectStandardError = true,
             UseShellExecute = false,
             CreateNoWindow = true
         };
-        using var proc = new Process { StartInfo = psi, EnableRaisingEvents = true };
-        var tcs = new TaskCompletionSource<int>(TaskCreationOptions.RunContinuationsAsynchronously);
+        using var proc = new Process { StartInfo = psi };
 
+        // Lines are handed to the callbacks as they arrive, so callers parse while the tool is still running
         proc.OutputDataReceived += (_, e) => { if (e.Data != null) onOutput?.Invoke(e.Data); };
         proc.ErrorDataReceived += (_, e) => { if (e.Data != null) onError?.Invoke(e.Data); };
-        proc.Exited += (_, __) => tcs.TrySetResult(proc.ExitCode);
 
         if (!proc.Start()) throw new InvalidOperationException($"Failed to start {fileName}");
         proc.BeginOutputReadLine();
@@ -28,8 +34,56 @@ public class ProcessRunner : IProcessRunner
 
         using (ct.Register(() => { try { if (!proc.HasExited) proc.Kill(true); } catch { } }))
         {
-            var exit = await tcs.Task.ConfigureAwait(false);
-            return exit;
+            // Unlike the Exited event, this also waits for both pipes to reach EOF, so no callback
+            // is still running (and no trailing line is lost) once the exit code is returned
+            await proc.WaitForExitAsync().ConfigureAwait(false);
+            return proc.ExitCode;
         }
     }
+
+    public async Task<int> RunWithOutputStreamAsync(string fileName, string arguments, Func<Stream, Task> readOutput, Action<string>? onError = null, CancellationToken ct = default)
+    {
+        var psi = new ProcessStartInfo
+        {
+            FileName = ResolveExecutable(fileName),
+            Arguments = arguments,
+            RedirectStandardOutput = true,
+            RedirectStandardError = true,
+            UseShellExecute = false,
+            CreateNoWindow = true
+        };
+        using var proc = new Process { StartInfo = psi };
+
+        proc.ErrorDataReceived += (_, e) => { if (e.Data != null) onError?.Invoke(e.Data); };
+
+        if (!proc.Start()) throw new InvalidOperationException($"Failed to start {fileName}");
+        proc.BeginErrorReadLine();
+
+        using (ct.Register(() => { try { if (!proc.HasExited) proc.Kill(true); } catch { } }))
+        {
+            var stdout = proc.StandardOutput.BaseStream;
+            try
+            {
+                await readOutput(stdout).ConfigureAwait(false);
+                // Drain anything the reader left so the child never blocks on a full pipe
+                await stdout.CopyToAsync(Stream.Null, ct).ConfigureAwait(false);
+            }
+            catch
+            {
+                try { if (!proc.HasExited) proc.Kill(true); } catch { }
+                throw;
+            }
+
+            await proc.WaitForExitAsync(ct).ConfigureAwait(false);
+            return proc.ExitCode;
+        }
+    }
+
+    // Process.Start walks PATH on every launch; reuse the full path found by the startup prerequisite check
+    private string ResolveExecutable(string fileName)
+    {
+        if (Path.IsPathRooted(fileName)) return fileName;
+
+        return _toolPaths.Resolve(fileName) ?? fileName;
+    }
 }
@@ -0,0 +1,37 @@
+using System.Collections.Concurrent;
+
+namespace BugZapperLabs.RipSharp.Services;
+
+public class ToolPathResolver : IToolPathResolver
+{
+    private readonly string? _pathValue;
+    private readonly bool _isWindows;
+    private readonly Func<string, bool> _fileExists;
+
+    // One instance serves the startup prerequisite check and every later launch, so each tool is searched for once.
+    // Only found paths are kept; a missing tool is looked up again next time.
+    private readonly ConcurrentDictionary<string, string> _resolvedPaths = new();
+
+    public ToolPathResolver()
+        : this(Environment.GetEnvironmentVariable("PATH"), OperatingSystem.IsWindows(), File.Exists)
+    {
+    }
+
+    public ToolPathResolver(string? pathValue, bool isWindows, Func<string, bool> fileExists)
+    {
+        _pathValue = pathValue;
+        _isWindows = isWindows;
+        _fileExists = fileExists;
+    }
+
+    public string? Resolve(string tool)
+    {
+        if (_resolvedPaths.TryGetValue(tool, out var cached))
+            return cached;
+
+        var path = PrerequisiteChecker.ResolveToolPath(tool, _pathValue, _isWindows, _fileExists);
+        if (path != null)
+            _resolvedPaths[tool] = path;
+        return path;
+    }
+}
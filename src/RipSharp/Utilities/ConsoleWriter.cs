@@ -1,3 +1,5 @@
+using System.Collections.Concurrent;
+
 using Spectre.Console;
 
 namespace BugZapperLabs.RipSharp.Utilities;
@@ -8,14 +10,16 @@ namespace BugZapperLabs.RipSharp.Utilities;
 public class ConsoleWriter : IConsoleWriter
 {
     private readonly IThemeProvider _theme;
+    private readonly ConcurrentDictionary<string, Style> _styles = new();
 
     public ConsoleWriter(IThemeProvider theme)
     {
         _theme = theme;
     }
 
-    private static void WriteColored(string color, string message)
-        => AnsiConsole.MarkupLine($"[{color}]{Markup.Escape(message)}[/]");
+    // Plain styled text: no markup escaping or re-parsing per message, and each theme color is parsed once
+    private void WriteColored(string color, string message)
+        => AnsiConsole.Write(new Text(message + Environment.NewLine, _styles.GetOrAdd(color, Style.Parse)));
 
     public void Info(string message) => WriteColored(_theme.Colors.Info, message);
     public void Success(string message) => WriteColored(_theme.Colors.Success, message);
@@ -1,13 +1,28 @@
+using System.Buffers;
+using System.Text;
+
 namespace BugZapperLabs.RipSharp.Utilities;
 
 public static class FileNaming
 {
+    private static readonly SearchValues<char> InvalidFileNameChars = SearchValues.Create(Path.GetInvalidFileNameChars());
+
     public static string SanitizeFileName(string s)
     {
-        var invalid = Path.GetInvalidFileNameChars();
-        foreach (var ch in invalid)
-            s = s.Replace(ch.ToString(), "");
-        return s.Trim();
+        // One pass over the name instead of a Replace (and a new string) per invalid character
+        var span = s.AsSpan();
+        var first = span.IndexOfAny(InvalidFileNameChars);
+        if (first < 0)
+            return s.Trim();
+
+        var sb = new StringBuilder(s.Length);
+        sb.Append(span[..first]);
+        foreach (var ch in span[(first + 1)..])
+        {
+            if (!InvalidFileNameChars.Contains(ch))
+                sb.Append(ch);
+        }
+        return sb.ToString().Trim();
     }
 
     public static string RenameFile(string filePath, ContentMetadata metadata, int? episodeNum, int seasonNum, string? versionSuffix = null, string? episodeTitle = null)
@@ -32,8 +47,8 @@ public static class FileNaming
             filename = $"{safeTitle}{yearPart}{safeSuffix}.mkv";
         }
         var newPath = Path.Combine(Path.GetDirectoryName(filePath)!, filename);
-        if (File.Exists(newPath)) File.Delete(newPath);
-        File.Move(filePath, newPath);
+        // Same-directory rename: overwrite replaces any existing file in one atomic rename
+        File.Move(filePath, newPath, overwrite: true);
         return newPath;
     }
 }
@@ -8,11 +8,27 @@ namespace BugZapperLabs.RipSharp.Utilities;
 /// </summary>
 public class SpectreProgressDisplay : IProgressDisplay
 {
+    private const int BarWidth = 80;
+
+    // The bar is a fixed width, so every possible filled/empty segment is built once rather than per frame
+    private static readonly string[] FilledBars = BuildBarSegments('█');
+    private static readonly string[] EmptyBars = BuildBarSegments('░');
+
     private readonly IThemeProvider _theme;
 
+    // Render runs several times a second; resolve theme colors into styles once instead of every frame
+    private readonly Style _successStyle;
+    private readonly Style _highlightStyle;
+    private readonly Style _accentStyle;
+    private readonly Style _mutedStyle;
+
     public SpectreProgressDisplay(IThemeProvider theme)
     {
         _theme = theme;
+        _successStyle = new Style(theme.SuccessColor);
+        _highlightStyle = new Style(theme.HighlightColor);
+        _accentStyle = new Style(theme.AccentColor);
+        _mutedStyle = new Style(theme.MutedColor);
     }
 
     public async Task ExecuteAsync(Func<IProgressContext, Task> action)
@@ -27,9 +43,19 @@ public class SpectreProgressDisplay : IProgressDisplay
                 using var refreshCts = new CancellationTokenSource();
                 var refreshTask = Task.Run(async () =>
                 {
+                    long renderedVersion = -1;
+                    var renderedAt = DateTime.MinValue;
                     while (!refreshCts.IsCancellationRequested)
                     {
-                        live.UpdateTarget(Render(liveContext));
+                        // Skip repaints when no task changed; still repaint once a second so the elapsed/remaining times tick
+                        var version = liveContext.GetVersion();
+                        var now = DateTime.UtcNow;
+                        if (version != renderedVersion || now - renderedAt >= TimeSpan.FromSeconds(1))
+                        {
+                            live.UpdateTarget(Render(liveContext));
+                            renderedVersion = version;
+                            renderedAt = now;
+                        }
                         await Task.Delay(150, refreshCts.Token).ConfigureAwait(false);
                     }
                 }, refreshCts.Token);
@@ -64,7 +90,7 @@ public class SpectreProgressDisplay : IProgressDisplay
         {
             Header = new PanelHeader("Ripping", Justify.Left),
             Border = BoxBorder.Rounded,
-            BorderStyle = _theme.SuccessColor,
+            BorderStyle = _successStyle,
             Expand = true
         };
 
@@ -72,7 +98,7 @@ public class SpectreProgressDisplay : IProgressDisplay
         {
             Header = new PanelHeader("Encoding", Justify.Left),
             Border = BoxBorder.Rounded,
-            BorderStyle = _theme.HighlightColor,
+            BorderStyle = _highlightStyle,
             Expand = true
         };
 
@@ -80,7 +106,7 @@ public class SpectreProgressDisplay : IProgressDisplay
         {
             Header = new PanelHeader("Overall Progress", Justify.Left),
             Border = BoxBorder.Rounded,
-            BorderStyle = _theme.AccentColor,
+            BorderStyle = _accentStyle,
             Expand = true
         };
 
@@ -97,15 +123,13 @@ public class SpectreProgressDisplay : IProgressDisplay
     {
         if (task == null)
         {
-            return new Text($"Waiting for {label.ToLower()} to start...", new Style(_theme.MutedColor));
+            return new Text($"Waiting for {label.ToLower()} to start...", _mutedStyle);
         }
 
         var percent = task.MaxValue > 0 ? Math.Clamp((double)task.Value / task.MaxValue, 0, 1) : 0;
-        const int barWidth = 80;
-        var filled = (int)Math.Round(percent * barWidth);
-        var empty = Math.Max(0, barWidth - filled);
-        var filledBar = new string('█', filled);
-        var emptyBar = new string('░', empty);
+        var filled = (int)Math.Round(percent * BarWidth);
+        var filledBar = FilledBars[filled];
+        var emptyBar = EmptyBars[BarWidth - filled];
         var pctText = (percent * 100).ToString("0.0").PadLeft(6);
 
         // Calculate elapsed and remaining time
@@ -126,14 +150,16 @@ public class SpectreProgressDisplay : IProgressDisplay
 
         var timeInfo = $"{elapsedStr} / {remainingStr}";
 
-        // Combine filled and empty bars with different colors
-        var barRenderable = new Markup($"[{_theme.Colors.Success}]{filledBar}[/][{_theme.Colors.Muted}]{emptyBar}[/]");
+        // Combine filled and empty bars with different colors (styled segments, no markup to parse)
+        var barRenderable = new Paragraph()
+            .Append(filledBar, _successStyle)
+            .Append(emptyBar, _mutedStyle);
 
         var progressBar = new Columns(new IRenderable[]
         {
             barRenderable,
-            new Text($"{pctText}%", _theme.AccentColor),
-            new Text($"  {timeInfo}", _theme.MutedColor)
+            new Text($"{pctText}%", _accentStyle),
+            new Text($"  {timeInfo}", _mutedStyle)
         });
 
         var messages = task.GetRecentMessages(5);
@@ -145,7 +171,7 @@ public class SpectreProgressDisplay : IProgressDisplay
         var rows = new List<IRenderable> { progressBar };
         foreach (var msg in messages)
         {
-            rows.Add(new Text(msg, new Style(_theme.MutedColor)));
+            rows.Add(new Text(msg, _mutedStyle));
         }
 
         return new Rows(rows);
@@ -156,6 +182,16 @@ public class SpectreProgressDisplay : IProgressDisplay
         return $"{(int)ts.TotalHours:00}:{ts.Minutes:00}:{ts.Seconds:00}";
     }
 
+    private static string[] BuildBarSegments(char glyph)
+    {
+        var segments = new string[BarWidth + 1];
+        for (int i = 0; i <= BarWidth; i++)
+        {
+            segments[i] = new string(glyph, i);
+        }
+        return segments;
+    }
+
     private class LiveProgressContext : IProgressContext
     {
         private readonly List<LiveTask> _tasks = new();
@@ -182,18 +218,36 @@ public class SpectreProgressDisplay : IProgressDisplay
                 return (ripTask, encodeTask, overallTask);
             }
         }
+
+        // Grows whenever a task is added or changed, so the refresh loop can tell when a repaint is needed
+        public long GetVersion()
+        {
+            lock (_lock)
+            {
+                long version = _tasks.Count;
+                foreach (var task in _tasks)
+                {
+                    version += task.Version;
+                }
+                return version;
+            }
+        }
     }
 
     private class LiveTask : IProgressTask
     {
+        // Only the most recent messages are ever rendered; cap the history so long rips don't accumulate output
+        private const int MaxRetainedMessages = 50;
+
         private readonly object _lock = new();
         private long _value;
         private readonly long _maxValue;
         private string _description;
-        private readonly List<string> _messages = new();
+        private readonly Queue<string> _messages = new();
         private bool _isStopped;
         private DateTime? _startTime;
         private DateTime? _stopTime;
+        private int _version;
 
         public LiveTask(string description, long maxValue)
         {
@@ -207,6 +261,11 @@ public class SpectreProgressDisplay : IProgressDisplay
             get { lock (_lock) { return _isStopped; } }
         }
 
+        public int Version
+        {
+            get { lock (_lock) { return _version; } }
+        }
+
         public TimeSpan GetElapsed()
         {
             lock (_lock)
@@ -229,6 +288,7 @@ public class SpectreProgressDisplay : IProgressDisplay
                 {
                     if (value <= 0)
                     {
+                        _version++;
                         _value = 0;
                         _startTime = null;
                         _stopTime = null;
@@ -241,7 +301,12 @@ public class SpectreProgressDisplay : IProgressDisplay
                         _startTime = DateTime.UtcNow;
                         _stopTime = null;
                     }
-                    _value = Math.Min(value, _maxValue);
+                    var clamped = Math.Min(value, _maxValue);
+                    if (clamped != _value)
+                    {
+                        _value = clamped;
+                        _version++;
+                    }
                 }
             }
         }
@@ -258,13 +323,14 @@ public class SpectreProgressDisplay : IProgressDisplay
                     _startTime = DateTime.UtcNow;
                 }
                 _value = Math.Min(_value + value, _maxValue);
+                _version++;
             }
         }
 
         public string Description
         {
             get { lock (_lock) { return _description; } }
-            set { lock (_lock) { _description = value; } }
+            set { lock (_lock) { _description = value; _version++; } }
         }
 
         public void StopTask()
@@ -278,6 +344,7 @@ public class SpectreProgressDisplay : IProgressDisplay
                 _value = _maxValue;
                 _isStopped = true;
                 _stopTime = DateTime.UtcNow;
+                _version++;
             }
         }
 
@@ -285,7 +352,12 @@ public class SpectreProgressDisplay : IProgressDisplay
         {
             lock (_lock)
             {
-                _messages.Add(message);
+                _messages.Enqueue(message);
+                _version++;
+                if (_messages.Count > MaxRetainedMessages)
+                {
+                    _messages.Dequeue();
+                }
             }
         }
 
@@ -294,6 +366,7 @@ public class SpectreProgressDisplay : IProgressDisplay
             lock (_lock)
             {
                 _messages.Clear();
+                _version++;
             }
         }
 
@@ -1,7 +1,5 @@
 using System.Globalization;
 
-using BugZapperLabs.RipSharp.Core;
-
 using Microsoft.Extensions.Options;
 
 using Spectre.Console;